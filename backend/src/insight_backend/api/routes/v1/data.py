@@ -224,6 +224,7 @@ def update_column_roles(  # type: ignore[valid-type]
         sub_category_field=sub_category_field,
     )
     session.commit()
+    _service.clear_overview_cache(table_name)
 
     return ColumnRolesResponse(
         source=table_name,
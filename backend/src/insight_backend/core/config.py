@@ -111,6 +111,8 @@ class Settings(BaseSettings):
     mindsdb_token: str | None = Field(None, alias="MINDSDB_TOKEN")
     mindsdb_embeddings_config_path: str | None = Field(None, alias="MINDSDB_EMBEDDINGS_CONFIG_PATH")
     mindsdb_embedding_batch_size: int = Field(16, alias="MINDSDB_EMBEDDING_BATCH_SIZE")
+    mindsdb_embedding_concurrency: int = Field(1, alias="MINDSDB_EMBEDDING_CONCURRENCY")
+    mindsdb_sync_concurrency: int = Field(1, alias="MINDSDB_SYNC_CONCURRENCY")
     mindsdb_timeout_s: float = Field(120.0, alias="MINDSDB_TIMEOUT_S")
     rag_top_n: int = Field(3, alias="RAG_TOP_N")
     rag_table_row_cap: int = Field(500, alias="RAG_TABLE_ROW_CAP")
@@ -133,6 +135,13 @@ class Settings(BaseSettings):
             raise ValueError("MINDSDB_EMBEDDING_BATCH_SIZE must be > 0")
         return v
 
+    @field_validator("mindsdb_embedding_concurrency", "mindsdb_sync_concurrency")
+    @classmethod
+    def _validate_mindsdb_concurrency(cls, v: int, info: ValidationInfo) -> int:
+        if v <= 0:
+            raise ValueError(f"{info.field_name.upper()} must be > 0")
+        return v
+
     @field_validator("rag_top_n", "rag_table_row_cap", "rag_max_columns")
     @classmethod
     def _validate_positive_int(cls, v: int, info: ValidationInfo) -> int:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import csv
 from typing import Iterable, List, Dict, Any
@@ -9,6 +10,38 @@ import logging
 
 log = logging.getLogger("insight.repositories.data")
 
+# Full-file CSV reads go through a 1 MiB buffer instead of the 8 KiB default.
+CSV_READ_BUFFER_BYTES = 1 << 20
+
+
+# Cache header rows across requests; a new mtime makes a new key, so edits are picked up.
+@lru_cache(maxsize=256)
+def _read_header(path: str, mtime_ns: int) -> tuple[str, ...]:
+    delimiter = "," if path.lower().endswith(".csv") else "\t"
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        try:
+            return tuple(next(reader))
+        except StopIteration:
+            return ()
+
+
+# Adding, removing or renaming a table changes the directory mtime, hence the cache key.
+@lru_cache(maxsize=256)
+def _find_table_path(tables_dir: str, table_name: str, dir_mtime_ns: int) -> Path | None:
+    base = Path(tables_dir)
+    candidates = [base / f"{table_name}.csv", base / f"{table_name}.tsv"]
+    for c in candidates:
+        if c.exists():
+            return c
+    # fallback strict: match by stem if user passed full filename without ext
+    files = [p for p in base.iterdir() if p.is_file() and p.suffix.lower() in {".csv", ".tsv"}]
+    files.sort(key=lambda p: p.name.lower())
+    for p in files:
+        if p.stem == table_name:
+            return p
+    return None
+
 
 @dataclass
 class DataRepository:
@@ -46,29 +79,18 @@ class DataRepository:
         return names
 
     def _resolve_table_path(self, table_name: str) -> Path | None:
-        candidates = [self.tables_dir / f"{table_name}.csv", self.tables_dir / f"{table_name}.tsv"]
-        for c in candidates:
-            if c.exists():
-                return c
-        # fallback strict: match by stem if user passed full filename without ext
-        for p in self._iter_table_files():
-            if p.stem == table_name:
-                return p
-        return None
+        try:
+            dir_mtime_ns = self.tables_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return _find_table_path(str(self.tables_dir), table_name, dir_mtime_ns)
 
     def get_schema(self, table_name: str) -> list[tuple[str, str | None]]:
         path = self._resolve_table_path(table_name)
         if path is None:
             raise FileNotFoundError(f"Table introuvable: {table_name}")
 
-        delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        with path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            try:
-                header = next(reader)
-            except StopIteration:
-                header = []
-
+        header = _read_header(str(path), path.stat().st_mtime_ns)
         cols = [(h, None) for h in header]
         log.info("Schéma table '%s' (%d colonnes)", table_name, len(cols))
         return cols
@@ -78,8 +100,8 @@ class DataRepository:
         if path is None:
             raise FileNotFoundError(f"Table introuvable: {table_name}")
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        with path.open("r", newline="", encoding="utf-8") as f:
+        with path.open("r", newline="", encoding="utf-8", buffering=CSV_READ_BUFFER_BYTES) as f:
             reader = csv.DictReader(f, delimiter=delimiter)
-            rows = [dict(row) for row in reader if row]
+            rows = [row for row in reader if row]
         log.info("Chargé %d lignes depuis %s", len(rows), path.name)
         return rows
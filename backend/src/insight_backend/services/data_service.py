@@ -1,10 +1,20 @@
 import logging
-from collections import Counter
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import astuple, dataclass, field
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Collection, Iterable, Mapping
+from typing import BinaryIO, Collection, Iterable, Iterator, Mapping
 import csv
+import heapq
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
 
 from ..schemas.data import (
     IngestResponse,
@@ -16,7 +26,7 @@ from ..schemas.data import (
     TableExplorePreview,
 )
 from ..schemas.tables import TableInfo, ColumnInfo
-from ..repositories.data_repository import DataRepository
+from ..repositories.data_repository import CSV_READ_BUFFER_BYTES, DataRepository
 from ..core.config import settings
 
 
@@ -38,6 +48,15 @@ DATE_CONFIDENCE_RATIO = 0.55
 DATE_FIELD_HINT = "date"
 CATEGORY_COLUMN_NAME = "Category"
 SUB_CATEGORY_COLUMN_NAME = "Sub Category"
+OVERVIEW_CACHE_DIR_NAME = ".overview_cache"
+OVERVIEW_BLOCK_ROWS = 65_536
+TABLE_SUFFIXES = frozenset({".csv", ".tsv"})
+INTERN_MAX_LENGTH = 64
+DATE_PARSE_CACHE_SIZE = 100_000
+OVERVIEW_MEMORY_CACHE_SIZE = 64
+EXPLORE_INDEX_MAX_BYTES = 1024 * 1024 * 1024
+OVERVIEW_MAX_WORKERS = 8
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
 
 
 @dataclass(frozen=True)
@@ -47,21 +66,105 @@ class ColumnRoles:
     sub_category_field: str | None = None
 
 
+@dataclass(frozen=True)
+class TableLayout:
+    """Column roles and positions resolved once per (header, roles) combination."""
+
+    columns: tuple[tuple[str, int], ...]
+    date_field: str | None = None
+    category_field: str | None = None
+    sub_category_field: str | None = None
+    date_idx: int | None = None
+    category_idx: int | None = None
+    sub_category_idx: int | None = None
+
+
+@lru_cache(maxsize=256)
+def _table_layout(headers: tuple[str, ...], roles: ColumnRoles, table_name: str) -> TableLayout:
+    # Last index wins for duplicated headers, as with csv.DictReader.
+    index_of = {name: idx for idx, name in enumerate(headers)}
+
+    date_field = None
+    if roles.date_field:
+        if roles.date_field not in index_of:
+            raise ValueError(f"Colonne '{roles.date_field}' introuvable pour la date dans {table_name}")
+        date_field = roles.date_field
+    else:
+        for name in headers:
+            if name.casefold() == "date":
+                date_field = name
+                break
+
+    category_field = None
+    if roles.category_field:
+        if roles.category_field not in index_of:
+            raise ValueError(
+                f"Colonne '{roles.category_field}' introuvable pour la catégorie dans {table_name}"
+            )
+        category_field = roles.category_field
+    elif CATEGORY_COLUMN_NAME in index_of:
+        category_field = CATEGORY_COLUMN_NAME
+
+    sub_category_field = None
+    if roles.sub_category_field:
+        if roles.sub_category_field not in index_of:
+            raise ValueError(
+                f"Colonne '{roles.sub_category_field}' introuvable pour la sous-catégorie dans {table_name}"
+            )
+        sub_category_field = roles.sub_category_field
+    elif SUB_CATEGORY_COLUMN_NAME in index_of:
+        sub_category_field = SUB_CATEGORY_COLUMN_NAME
+
+    return TableLayout(
+        columns=tuple(index_of.items()),
+        date_field=date_field,
+        category_field=category_field,
+        sub_category_field=sub_category_field,
+        date_idx=index_of[date_field] if date_field else None,
+        category_idx=index_of[category_field] if category_field else None,
+        sub_category_idx=index_of[sub_category_field] if sub_category_field else None,
+    )
+
+
+@lru_cache(maxsize=256)
+def _casefold_names(names: frozenset[str]) -> frozenset[str]:
+    """Casefolded permission set, shared by every call made with the same allowed tables."""
+
+    return frozenset(name.casefold() for name in names)
+
+
 def _clean_text(value: object | None) -> str | None:
     if value is None:
         return None
-    text = str(value).strip()
-    return text or None
+    text = (value if isinstance(value, str) else str(value)).strip()
+    if not text:
+        return None
+    return sys.intern(text) if len(text) <= INTERN_MAX_LENGTH else text
 
 
 def _normalize_date(value: object | None) -> str | None:
     text = _clean_text(value)
     if not text:
         return None
-    candidates = [
-        text.replace(" ", "T"),
-        text,
-    ]
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date_text(text: str) -> str | None:
+    """Parse a cleaned date string; memoised because date columns repeat values."""
+
+    # Every accepted format starts with a digit and needs at least 6 characters
+    # (8 when digits only): reject plain text, codes and counts without raising.
+    if not text[0].isdigit() or len(text) < 6 or (len(text) < 8 and text.isdigit()):
+        log.debug("Impossible de parser la date %r", text)
+        return None
+    if _ISO_DATE_RE.fullmatch(text):
+        try:
+            return date(int(text[:4]), int(text[5:7]), int(text[8:])).isoformat()
+        except ValueError:
+            pass
+    # Without a space both candidates are identical: try the text only once.
+    candidates = [text.replace(" ", "T"), text] if " " in text else [text]
     for raw in candidates:
         try:
             dt = datetime.fromisoformat(raw)
@@ -78,61 +181,152 @@ def _normalize_date(value: object | None) -> str | None:
     return None
 
 
+# Row shaped like csv.DictReader output, re-read from the file for the requested page only.
+ExploreRow = dict[str, str | int | float | bool | None]
+# Byte offsets of each record of a (Category, Sub Category) pair, in file order.
+ExploreGroups = dict[tuple[str, str], array]
+
+
+def _csv_records(handle: BinaryIO, delimiter: str) -> Iterator[list[str]]:
+    # Binary lines keep handle.tell() exact at record boundaries; csv.reader never reads ahead.
+    return csv.reader((line.decode("utf-8") for line in handle), delimiter=delimiter)
+
+
+def _records_at(handle: BinaryIO, offsets: Iterable[int], delimiter: str) -> Iterator[list[str]]:
+    """Parse the records starting at each offset, seeking only when they are not contiguous."""
+
+    reader = None
+    for offset in offsets:
+        if reader is None or handle.tell() != offset:
+            handle.seek(offset)
+            reader = _csv_records(handle, delimiter)
+        yield next(reader)
+
+
+def _explore_record(fieldnames: list[str], row: list[str]) -> ExploreRow:
+    record: dict = dict(zip(fieldnames, row))
+    # Same shape as csv.DictReader rows: extra cells under None, missing cells as None.
+    width = len(fieldnames)
+    if len(row) > width:
+        record[None] = row[width:]
+    else:
+        for key in fieldnames[len(row) :]:
+            record[key] = None
+    return record
+
+
+def _index_explore_groups(
+    handle: BinaryIO,
+    delimiter: str,
+    category_column: str,
+    sub_category_column: str,
+    *,
+    only: tuple[str, str] | None = None,
+) -> ExploreGroups:
+    """Map each (Category, Sub Category) pair to its record offsets; with `only`, keep that pair alone."""
+
+    groups: ExploreGroups = {}
+    handle.seek(0)
+    reader = _csv_records(handle, delimiter)
+    fieldnames = next(reader, [])
+    index_of = {name: idx for idx, name in enumerate(fieldnames)}
+    category_idx = index_of[category_column]
+    sub_category_idx = index_of[sub_category_column]
+    # Category labels repeat on every row: clean each raw pair once.
+    group_keys: dict[tuple[str, str], tuple[str, str] | None] = {}
+    while True:
+        start = handle.tell()
+        row = next(reader, None)
+        if row is None:
+            break
+        size = len(row)
+        raw_category = row[category_idx] if category_idx < size else None
+        raw_sub_category = row[sub_category_idx] if sub_category_idx < size else None
+        if not raw_category or not raw_sub_category:
+            continue
+        raw_pair = (raw_category, raw_sub_category)
+        if raw_pair in group_keys:
+            group_key = group_keys[raw_pair]
+        else:
+            cat_value = _clean_text(raw_category)
+            sub_value = _clean_text(raw_sub_category)
+            group_key = (cat_value, sub_value) if cat_value and sub_value else None
+            if only is not None and group_key != only:
+                group_key = None
+            group_keys[raw_pair] = group_key
+        if group_key is None:
+            continue
+        offsets = groups.get(group_key)
+        if offsets is None:
+            offsets = groups[group_key] = array("q")
+        offsets.append(start)
+    return groups
+
+
 @dataclass
 class FieldAccumulator:
     name: str
-    raw_counter: Counter[str] = field(default_factory=Counter)
-    date_counter: Counter[str] = field(default_factory=Counter)
+    cell_counter: Counter[str] = field(default_factory=Counter)
+    raw_counter: dict[str, int] = field(default_factory=dict)
+    date_counter: dict[str, int] = field(default_factory=dict)
     non_null: int = 0
     parsed_dates: int = 0
     parse_dates: bool = True
+    has_date_hint: bool = field(init=False)
 
-    def add(self, value: object | None) -> None:
-        text = _clean_text(value)
-        if text is None:
-            return
+    def __post_init__(self) -> None:
+        self.has_date_hint = DATE_FIELD_HINT in self.name.lower()
 
-        self.non_null += 1
+    def add_many(self, values: Iterable[str]) -> None:
+        """Count a block of untouched cells at once (Counter.update counts in C)."""
 
-        if self.parse_dates:
-            normalized_date = _normalize_date(text)
-            if normalized_date:
-                self.parsed_dates += 1
-                self.date_counter[normalized_date] += 1
+        self.cell_counter.update(values)
 
-        self.raw_counter[text] += 1
+    def _fold_cells(self) -> None:
+        """Clean and date-parse each distinct pending cell once; only new cells are added."""
+
+        raw_counter = self.raw_counter
+        date_counter = self.date_counter
+        for cell, count in self.cell_counter.items():
+            text = cell.strip()
+            if not text:
+                continue
+            raw_counter[text] = raw_counter.get(text, 0) + count
+            self.non_null += count
+            if self.parse_dates:
+                normalized = _normalize_date(text)
+                if normalized:
+                    date_counter[normalized] = date_counter.get(normalized, 0) + count
+                    self.parsed_dates += count
+        self.cell_counter.clear()
 
     def build_breakdown(self, *, total_rows: int) -> FieldBreakdown:
         """Convert the accumulated values into a serializable breakdown."""
 
+        self._fold_cells()
         kind = "text"
         counter = self.raw_counter
 
         if self.date_counter and self.non_null:
             date_ratio = self.parsed_dates / self.non_null
-            if date_ratio >= DATE_CONFIDENCE_RATIO or DATE_FIELD_HINT in self.name.lower():
+            if date_ratio >= DATE_CONFIDENCE_RATIO or self.has_date_hint:
                 kind = "date"
                 counter = self.date_counter
 
         if kind == "date":
-            items = sorted(counter.items(), key=lambda item: item[0])
-            if len(items) > MAX_VALUES_PER_FIELD:
-                items = items[-MAX_VALUES_PER_FIELD:]
-                truncated = True
-            else:
-                truncated = False
+            items = heapq.nlargest(MAX_VALUES_PER_FIELD, counter.items(), key=lambda item: item[0])
+            items.reverse()
         else:
-            items = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
-            if len(items) > MAX_VALUES_PER_FIELD:
-                items = items[:MAX_VALUES_PER_FIELD]
-                truncated = True
-            else:
-                truncated = False
+            items = heapq.nsmallest(
+                MAX_VALUES_PER_FIELD, counter.items(), key=lambda item: (-item[1], item[0])
+            )
+        truncated = len(counter) > MAX_VALUES_PER_FIELD
 
-        counts = [ValueCount(label=label, count=count) for label, count in items]
+        # Values come straight from the scan: skip pydantic validation for these trusted models.
+        counts = [ValueCount.model_construct(label=label, count=count) for label, count in items]
         missing_values = max(total_rows - self.non_null, 0)
 
-        return FieldBreakdown(
+        return FieldBreakdown.model_construct(
             field=self.name,
             label=self.name,
             kind=kind,
@@ -149,25 +343,145 @@ class DataService:
 
     def __init__(self, repo: DataRepository | None = None):
         self.repo = repo or DataRepository(tables_dir=Path(settings.tables_dir))
+        self._tables_cache: tuple[int, dict[str, Path]] | None = None
+        self._headers_cache: dict[Path, tuple[int, list[str]]] = {}
+        self._overview_cache: OrderedDict[tuple, DataSourceOverview] = OrderedDict()
+        self._overview_cache_lock = threading.Lock()
+        self._explore_cache: OrderedDict[tuple, ExploreGroups] = OrderedDict()
+        self._explore_pending: dict[tuple, Future] = {}
+        self._explore_cache_lock = threading.Lock()
+
+    def _table_paths(self) -> dict[str, Path]:
+        """Map table names to files, rescanning only when tables_dir mtime changes."""
+
+        try:
+            mtime_ns = self.repo.tables_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        cached = self._tables_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with os.scandir(self.repo.tables_dir) as entries:
+            files = sorted(
+                (
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in TABLE_SUFFIXES
+                ),
+                key=lambda p: p.name.lower(),
+            )
+        paths: dict[str, Path] = {}
+        for p in files:
+            paths.setdefault(p.stem, p)
+        self._tables_cache = (mtime_ns, paths)
+        log.info("Tables découvertes (%d): %s", len(paths), list(paths))
+        return paths
+
+    def _table_headers(self, path: Path) -> list[str]:
+        """Return the header row of a table, re-read only when the file mtime changes."""
+
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._headers_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        delimiter = "," if path.suffix.lower() == ".csv" else "\t"
+        with path.open("r", newline="", encoding="utf-8") as handle:
+            headers = next(csv.reader(handle, delimiter=delimiter), [])
+        self._headers_cache[path] = (mtime_ns, headers)
+        return headers
+
+    def clear_overview_cache(self, table_name: str) -> None:
+        """Drop in-memory overview and explore entries of a table (e.g. after a role change)."""
+
+        path = self._table_paths().get(table_name)
+        if path is None:
+            return
+        prefix = str(path)
+        with self._overview_cache_lock:
+            stale = [key for key in self._overview_cache if key[0] == prefix]
+            for key in stale:
+                del self._overview_cache[key]
+        with self._explore_cache_lock:
+            stale_index = [key for key in self._explore_cache if key[0] == prefix]
+            for key in stale_index:
+                del self._explore_cache[key]
+        log.info(
+            "Caches mémoire vidés pour %s (overview=%d, explore=%d)",
+            table_name,
+            len(stale),
+            len(stale_index),
+        )
+
+    def _explore_group(
+        self,
+        handle: BinaryIO,
+        *,
+        table_name: str,
+        delimiter: str,
+        category_column: str,
+        sub_category_column: str,
+        group_key: tuple[str, str],
+    ) -> array:
+        """Record offsets of one (Category, Sub Category) pair, from an index cached per file version."""
+
+        stat = os.fstat(handle.fileno())
+        if stat.st_size > EXPLORE_INDEX_MAX_BYTES:
+            log.info(
+                "Table %s trop volumineuse pour l'index explore (%d octets) : lecture directe",
+                table_name,
+                stat.st_size,
+            )
+            groups = _index_explore_groups(
+                handle, delimiter, category_column, sub_category_column, only=group_key
+            )
+            return groups.get(group_key, array("q"))
+
+        cache_key = (handle.name, stat.st_mtime_ns, stat.st_size, category_column, sub_category_column)
+        with self._explore_cache_lock:
+            groups = self._explore_cache.get(cache_key)
+            if groups is not None:
+                self._explore_cache.move_to_end(cache_key)
+                return groups.get(group_key, array("q"))
+            # One scan per file version: concurrent misses wait for the first builder.
+            pending = self._explore_pending.get(cache_key)
+            builder = pending is None
+            if builder:
+                pending = self._explore_pending[cache_key] = Future()
+        if not builder:
+            return pending.result().get(group_key, array("q"))
+
+        try:
+            groups = _index_explore_groups(handle, delimiter, category_column, sub_category_column)
+        except BaseException as exc:
+            with self._explore_cache_lock:
+                del self._explore_pending[cache_key]
+            pending.set_exception(exc)
+            raise
+        log.info("Index explore construit pour %s : %d couples Category/Sub", table_name, len(groups))
+        with self._explore_cache_lock:
+            del self._explore_pending[cache_key]
+            self._explore_cache[cache_key] = groups
+            # One budget for all cached tables, counted in indexed source bytes.
+            while sum(key[2] for key in self._explore_cache) > EXPLORE_INDEX_MAX_BYTES:
+                self._explore_cache.popitem(last=False)
+        pending.set_result(groups)
+        return groups.get(group_key, array("q"))
 
     def ingest(self, *, path: str | None = None, bytes_: bytes | None = None) -> IngestResponse:  # type: ignore[valid-type]
         raise NotImplementedError
 
     def list_tables(self, *, allowed_tables: Iterable[str] | None = None) -> list[TableInfo]:
-        names = self.repo.list_tables()
+        paths = self._table_paths()
+        names = list(paths)
         if allowed_tables is not None:
-            allowed_set = {name.casefold() for name in allowed_tables}
+            allowed_set = _casefold_names(frozenset(allowed_tables))
             names = [n for n in names if n.casefold() in allowed_set]
             log.debug("Filtered tables with permissions (count=%d)", len(names))
-        infos: list[TableInfo] = []
-        for n in names:
-            p = self.repo._resolve_table_path(n)  # internal helper is fine here
-            infos.append(TableInfo(name=n, path=str(p) if p else ""))
-        return infos
+        return [TableInfo(name=n, path=str(paths[n])) for n in names]
 
     def get_schema(self, table_name: str, *, allowed_tables: Iterable[str] | None = None) -> list[ColumnInfo]:
         if allowed_tables is not None:
-            allowed_set = {name.casefold() for name in allowed_tables}
+            allowed_set = _casefold_names(frozenset(allowed_tables))
             if table_name.casefold() not in allowed_set:
                 log.warning("Permission denied for schema access table=%s", table_name)
                 raise PermissionError(f"Access to table '{table_name}' is not permitted")
@@ -189,9 +503,9 @@ class DataService:
         lightweight: bool = False,
         headers_only: bool = False,
     ) -> DataOverviewResponse:
-        table_names = self.repo.list_tables()
+        table_names = list(self._table_paths())
         if allowed_tables is not None:
-            allowed_set = {name.casefold() for name in allowed_tables}
+            allowed_set = _casefold_names(frozenset(allowed_tables))
             table_names = [name for name in table_names if name.casefold() in allowed_set]
             log.debug("Filtered overview tables with permissions (count=%d)", len(table_names))
 
@@ -230,28 +544,24 @@ class DataService:
             table_names = [name for name in table_names if _is_enabled(name)]
             log.debug("Filtered overview tables for explorer flag (count=%d)", len(table_names))
 
-        sources: list[DataSourceOverview] = []
-        for name in table_names:
+        def _overview_for(name: str) -> DataSourceOverview | None:
             hidden_for_table = hidden_lookup.get(name.casefold(), set())
             enabled_for_table = _is_enabled(name)
             if include_disabled_sources and skip_overview_for_disabled and not enabled_for_table:
                 roles = roles_lookup.get(name.casefold())
-                sources.append(
-                    DataSourceOverview(
-                        source=name,
-                        title=TABLE_TITLES.get(name, name),
-                        total_rows=0,
-                        field_count=0,
-                        fields=[],
-                        category_breakdown=[],
-                        date_field=roles.date_field if roles else None,
-                        category_field=roles.category_field if roles else None,
-                        sub_category_field=roles.sub_category_field if roles else None,
-                        explorer_enabled=False,
-                    )
+                return DataSourceOverview(
+                    source=name,
+                    title=TABLE_TITLES.get(name, name),
+                    total_rows=0,
+                    field_count=0,
+                    fields=[],
+                    category_breakdown=[],
+                    date_field=roles.date_field if roles else None,
+                    category_field=roles.category_field if roles else None,
+                    sub_category_field=roles.sub_category_field if roles else None,
+                    explorer_enabled=False,
                 )
-                continue
-            overview = self._compute_table_overview(
+            return self._compute_table_overview(
                 table_name=name,
                 hidden_fields=hidden_for_table,
                 include_hidden_fields=include_hidden_fields,
@@ -262,8 +572,28 @@ class DataService:
                 lightweight=lightweight,
                 headers_only=headers_only,
             )
-            if overview:
-                sources.append(overview)
+
+        # Tables are independent files: overlap their reads, keep the listing order.
+        workers = min(OVERVIEW_MAX_WORKERS, len(table_names))
+        if workers > 1:
+            paths = self._table_paths()
+
+            def _size(name: str) -> int:
+                try:
+                    return paths[name].stat().st_size
+                except (KeyError, OSError):
+                    return 0
+
+            # Largest files start first so the slowest scan does not end up last in the queue.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    name: executor.submit(_overview_for, name)
+                    for name in sorted(table_names, key=_size, reverse=True)
+                }
+                results = [futures[name].result() for name in table_names]
+        else:
+            results = [_overview_for(name) for name in table_names]
+        sources = [overview for overview in results if overview]
 
         return DataOverviewResponse(generated_at=datetime.now(timezone.utc), sources=sources)
 
@@ -280,19 +610,18 @@ class DataService:
         lightweight: bool = False,
         headers_only: bool = False,
     ) -> DataSourceOverview | None:
-        path = self.repo._resolve_table_path(table_name)
+        path = self._table_paths().get(table_name)
         if path is None:
             log.warning("Table introuvable pour l'overview: %s", table_name)
             return None
 
         if lightweight:
             try:
-                schema = self.repo.get_schema(table_name)
+                headers = self._table_headers(path)
             except FileNotFoundError:
                 log.warning("Table introuvable pour l'overview (lightweight): %s", table_name)
                 return None
 
-            headers = [name for name, _ in schema]
             if not headers:
                 return DataSourceOverview(
                     source=table_name,
@@ -351,11 +680,10 @@ class DataService:
 
         if headers_only:
             try:
-                schema = self.repo.get_schema(table_name)
+                headers = self._table_headers(path)
             except FileNotFoundError:
                 log.warning("Table introuvable pour l'overview (headers_only): %s", table_name)
                 return None
-            headers = [name for name, _ in schema]
             if not headers:
                 return DataSourceOverview(
                     source=table_name,
@@ -387,6 +715,114 @@ class DataService:
                 explorer_enabled=explorer_enabled,
             )
 
+        roles = column_roles or ColumnRoles()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            log.warning("Table introuvable pour l'overview: %s", table_name)
+            return None
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size, roles, date_from, date_to)
+        with self._overview_cache_lock:
+            cached = self._overview_cache.get(cache_key)
+            if cached is not None:
+                self._overview_cache.move_to_end(cache_key)
+        if cached is None:
+            use_sidecar = not (date_from or date_to)
+            cached = self._load_overview_sidecar(path, roles) if use_sidecar else None
+            if cached is None:
+                cached = self._scan_table_overview(
+                    path=path,
+                    table_name=table_name,
+                    roles=roles,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
+                if cached is None:
+                    return None
+                if use_sidecar:
+                    self._save_overview_sidecar(path, roles, cached)
+            with self._overview_cache_lock:
+                self._overview_cache[cache_key] = cached
+                if len(self._overview_cache) > OVERVIEW_MEMORY_CACHE_SIZE:
+                    self._overview_cache.popitem(last=False)
+        else:
+            log.debug("Overview servi depuis le cache mémoire pour %s", table_name)
+        # Only fields get per-request flags: copy them, share the immutable counts and breakdown.
+        overview = cached.model_copy(update={"fields": [item.model_copy() for item in cached.fields]})
+
+        hidden_set = set(hidden_fields or [])
+        for item in overview.fields:
+            item.hidden = item.field in hidden_set
+        if hidden_set and not include_hidden_fields:
+            overview.fields = [item for item in overview.fields if item.field not in hidden_set]
+        overview.explorer_enabled = explorer_enabled
+        return overview
+
+    @staticmethod
+    def _overview_sidecar_path(path: Path) -> Path:
+        return path.parent / OVERVIEW_CACHE_DIR_NAME / f"{path.name}.json"
+
+    def _load_overview_sidecar(self, path: Path, roles: ColumnRoles) -> DataSourceOverview | None:
+        sidecar = self._overview_sidecar_path(path)
+        try:
+            payload = json.loads(sidecar.read_text(encoding="utf-8"))
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            log.warning("Sidecar overview illisible %s: %s", sidecar, exc)
+            return None
+        if (
+            payload.get("source_mtime_ns") != stat.st_mtime_ns
+            or payload.get("source_size") != stat.st_size
+            or payload.get("roles") != list(astuple(roles))
+        ):
+            return None
+        log.debug("Overview chargé depuis le sidecar %s", sidecar.name)
+        return DataSourceOverview.model_validate(payload["overview"])
+
+    def _save_overview_sidecar(
+        self, path: Path, roles: ColumnRoles, overview: DataSourceOverview
+    ) -> None:
+        sidecar = self._overview_sidecar_path(path)
+        tmp_path: Path | None = None
+        try:
+            stat = path.stat()
+            sidecar.parent.mkdir(exist_ok=True)
+            payload = {
+                "source_mtime_ns": stat.st_mtime_ns,
+                "source_size": stat.st_size,
+                "roles": list(astuple(roles)),
+                "overview": overview.model_dump(mode="json"),
+            }
+            # Unique temp file per writer: concurrent scans (threads, workers) never share it
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=sidecar.parent,
+                prefix=f".{sidecar.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp_path = Path(tmp.name)
+                tmp.write(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_path, sidecar)
+        except OSError as exc:
+            log.warning("Impossible d'écrire le sidecar overview %s: %s", sidecar, exc)
+        finally:
+            # Already renamed on success; removes the partial file on any failure
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _scan_table_overview(
+        self,
+        *,
+        path: Path,
+        table_name: str,
+        roles: ColumnRoles,
+        date_from: str | None,
+        date_to: str | None,
+    ) -> DataSourceOverview | None:
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
         total_rows = 0
         date_min: str | None = None
@@ -394,10 +830,15 @@ class DataService:
         date_from_norm = date_from
         date_to_norm = date_to
 
-        category_pairs: Counter[tuple[str, str]] = Counter()
-        with path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            headers = reader.fieldnames or []
+        category_pairs: dict[tuple[str, str], int] = {}
+        with path.open(
+            "r", newline="", encoding="utf-8", buffering=CSV_READ_BUFFER_BYTES
+        ) as handle:
+            if hasattr(os, "posix_fadvise"):
+                # Full sequential scan: let the kernel widen readahead so disk reads overlap parsing.
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            reader = csv.reader(handle, delimiter=delimiter)
+            headers = next(reader, [])
             if not headers:
                 log.info("Aucune colonne détectée pour %s, rien à afficher.", table_name)
                 return DataSourceOverview(
@@ -408,41 +849,10 @@ class DataService:
                     fields=[],
                 )
 
-            roles = column_roles or ColumnRoles()
-            headers_set = set(headers)
-
-            date_field = None
-            if roles.date_field:
-                if roles.date_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.date_field}' introuvable pour la date dans {table_name}"
-                    )
-                date_field = roles.date_field
-            else:
-                for name in headers:
-                    if name.casefold() == "date":
-                        date_field = name
-                        break
-
-            category_field = None
-            if roles.category_field:
-                if roles.category_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.category_field}' introuvable pour la catégorie dans {table_name}"
-                    )
-                category_field = roles.category_field
-            elif CATEGORY_COLUMN_NAME in headers_set:
-                category_field = CATEGORY_COLUMN_NAME
-
-            sub_category_field = None
-            if roles.sub_category_field:
-                if roles.sub_category_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.sub_category_field}' introuvable pour la sous-catégorie dans {table_name}"
-                    )
-                sub_category_field = roles.sub_category_field
-            elif SUB_CATEGORY_COLUMN_NAME in headers_set:
-                sub_category_field = SUB_CATEGORY_COLUMN_NAME
+            layout = _table_layout(tuple(headers), roles, table_name)
+            date_field = layout.date_field
+            category_field = layout.category_field
+            sub_category_field = layout.sub_category_field
 
             if (date_from_norm or date_to_norm) and not date_field:
                 log.warning(
@@ -453,64 +863,99 @@ class DataService:
 
             accumulators = {
                 name: FieldAccumulator(name=name, parse_dates=name == date_field)
-                for name in headers
+                for name, _ in layout.columns
             }
 
-            for row in reader:
-                normalized_date = _normalize_date(row.get(date_field)) if date_field else None
-                if normalized_date:
+            width = len(headers)
+            date_idx = layout.date_idx
+            category_idx = layout.category_idx
+            sub_category_idx = layout.sub_category_idx
+            block: list[list[str]] = []
+            append = block.append
+            column_adds = tuple((accumulators[name].add_many, idx) for name, idx in layout.columns)
+            raw_pairs: Counter[tuple[str, str]] = Counter()
+
+            def flush_block() -> None:
+                # Transpose the block in C so each column is counted from one contiguous tuple.
+                columns = list(zip(*block))
+                if columns:
+                    for add_many, idx in column_adds:
+                        add_many(columns[idx])
+                    if category_idx is not None and sub_category_idx is not None:
+                        raw_pairs.update(zip(columns[category_idx], columns[sub_category_idx]))
+                block.clear()
+
+            # Without a date filter, date bounds come from the distinct values counted below.
+            if date_from_norm or date_to_norm:
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [""] * (width - len(row))
+                    raw_date = row[date_idx]
+                    normalized_date = _normalize_date(raw_date) if raw_date else None
+                    if normalized_date is None:
+                        continue
                     if date_min is None or normalized_date < date_min:
                         date_min = normalized_date
                     if date_max is None or normalized_date > date_max:
                         date_max = normalized_date
-
-                if date_from_norm or date_to_norm:
-                    if normalized_date is None:
-                        continue
                     if date_from_norm and normalized_date < date_from_norm:
                         continue
                     if date_to_norm and normalized_date > date_to_norm:
                         continue
-
-                total_rows += 1
-                for name, acc in accumulators.items():
-                    acc.add(row.get(name))
-                if category_field and sub_category_field:
-                    category_value = _clean_text(row.get(category_field))
-                    sub_category_value = _clean_text(row.get(sub_category_field))
-                    if category_value and sub_category_value:
-                        category_pairs[(category_value, sub_category_value)] += 1
+                    total_rows += 1
+                    append(row)
+                    if len(block) >= OVERVIEW_BLOCK_ROWS:
+                        flush_block()
+            else:
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [""] * (width - len(row))
+                    total_rows += 1
+                    append(row)
+                    if len(block) >= OVERVIEW_BLOCK_ROWS:
+                        flush_block()
+            flush_block()
+
+        # Clean each distinct raw pair once and merge pairs that clean to the same labels.
+        for (raw_category, raw_sub_category), count in raw_pairs.items():
+            if not raw_category or not raw_sub_category:
+                continue
+            category_value = _clean_text(raw_category)
+            sub_category_value = _clean_text(raw_sub_category)
+            if category_value and sub_category_value:
+                pair = (category_value, sub_category_value)
+                category_pairs[pair] = category_pairs.get(pair, 0) + count
 
         fields = [acc.build_breakdown(total_rows=total_rows) for acc in accumulators.values()]
-        hidden_set = set(hidden_fields or [])
-        for item in fields:
-            item.hidden = item.field in hidden_set
-
-        total_field_count = len(fields)
-        if hidden_set and not include_hidden_fields:
-            fields = [item for item in fields if item.field not in hidden_set]
-
-        visible_count = len(fields)
+        if date_field and not (date_from_norm or date_to_norm):
+            dates = accumulators[date_field].date_counter
+            if dates:
+                date_min, date_max = min(dates), max(dates)
         category_breakdown: list[CategorySubCategoryCount] = []
         if category_pairs:
-            items = sorted(category_pairs.items(), key=lambda item: (-item[1], item[0][0], item[0][1]))
-            if len(items) > MAX_VALUES_PER_FIELD:
-                items = items[:MAX_VALUES_PER_FIELD]
+            items = heapq.nsmallest(
+                MAX_VALUES_PER_FIELD,
+                category_pairs.items(),
+                key=lambda item: (-item[1], item[0][0], item[0][1]),
+            )
             category_breakdown = [
-                CategorySubCategoryCount(category=cat, sub_category=sub, count=count)
+                CategorySubCategoryCount.model_construct(category=cat, sub_category=sub, count=count)
                 for (cat, sub), count in items
             ]
 
         log.info(
             (
-                "Overview calculé pour %s : %d lignes, colonnes visibles=%d / total=%d, "
+                "Overview calculé pour %s : %d lignes, colonnes=%d, "
                 "couples Category/Sub=%d, date_field=%s, category_field=%s, sub_category_field=%s, "
                 "filtres=(from=%s, to=%s)"
             ),
             table_name,
             total_rows,
-            visible_count,
-            total_field_count,
+            len(fields),
             len(category_breakdown),
             date_field,
             category_field,
@@ -519,19 +964,18 @@ class DataService:
             date_to_norm,
         )
 
-        return DataSourceOverview(
+        return DataSourceOverview.model_construct(
             source=table_name,
             title=TABLE_TITLES.get(table_name, table_name),
             total_rows=total_rows,
             date_min=date_min,
             date_max=date_max,
-            field_count=total_field_count,
+            field_count=len(fields),
             fields=fields,
             category_breakdown=category_breakdown,
             date_field=date_field,
             category_field=category_field,
             sub_category_field=sub_category_field,
-            explorer_enabled=explorer_enabled,
         )
 
     def explore_table(
@@ -549,7 +993,7 @@ class DataService:
         column_roles: ColumnRoles | None = None,
     ) -> TableExplorePreview:
         if allowed_tables is not None:
-            allowed_set = {name.casefold() for name in allowed_tables}
+            allowed_set = _casefold_names(frozenset(allowed_tables))
             if table_name.casefold() not in allowed_set:
                 log.warning("Permission denied for explore access table=%s", table_name)
                 raise PermissionError(f"Access to table '{table_name}' is not permitted")
@@ -559,15 +1003,11 @@ class DataService:
         if offset < 0:
             raise ValueError("Paramètre 'offset' invalide (doit être >= 0)")
 
-        path = self.repo._resolve_table_path(table_name)
+        path = self._table_paths().get(table_name)
         if path is None:
             log.warning("Table introuvable pour l'explore: %s", table_name)
             raise FileNotFoundError(f"Table introuvable: {table_name}")
 
-        delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        matching_rows = 0
-        matched_rows: list[dict[str, str | int | float | bool | None]] = []
-
         normalized_from = _normalize_date(date_from) if date_from else None
         normalized_to = _normalize_date(date_to) if date_to else None
         if date_from and not normalized_from:
@@ -575,108 +1015,119 @@ class DataService:
         if date_to and not normalized_to:
             raise ValueError("Paramètre 'date_to' invalide (format attendu ISO 8601).")
 
-        date_domain_min: str | None = None
-        date_domain_max: str | None = None
+        headers = self._table_headers(path)
+        if not headers:
+            log.info("Aucune colonne détectée pour %s, rien à explorer.", table_name)
+            return TableExplorePreview(
+                source=table_name,
+                category=category,
+                sub_category=sub_category,
+                matching_rows=0,
+                preview_columns=[],
+                preview_rows=[],
+                limit=limit,
+                offset=offset,
+                sort_date=sort_date,
+            )
 
-        with path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            headers = reader.fieldnames or []
-            if not headers:
-                log.info("Aucune colonne détectée pour %s, rien à explorer.", table_name)
-                return TableExplorePreview(
-                    source=table_name,
-                    category=category,
-                    sub_category=sub_category,
-                    matching_rows=0,
-                    preview_columns=[],
-                    preview_rows=[],
-                    limit=limit,
-                    offset=offset,
-                    sort_date=sort_date,
-                )
+        roles = column_roles or ColumnRoles()
+        headers_set = set(headers)
 
-            roles = column_roles or ColumnRoles()
-            headers_set = set(headers)
+        category_column = None
+        if roles.category_field:
+            if roles.category_field not in headers_set:
+                raise ValueError(
+                    f"Colonne '{roles.category_field}' introuvable pour la catégorie dans {table_name}"
+                )
+            category_column = roles.category_field
+        elif CATEGORY_COLUMN_NAME in headers_set:
+            category_column = CATEGORY_COLUMN_NAME
 
-            category_column = None
-            if roles.category_field:
-                if roles.category_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.category_field}' introuvable pour la catégorie dans {table_name}"
-                    )
-                category_column = roles.category_field
-            elif CATEGORY_COLUMN_NAME in headers_set:
-                category_column = CATEGORY_COLUMN_NAME
-
-            sub_category_column = None
-            if roles.sub_category_field:
-                if roles.sub_category_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.sub_category_field}' introuvable pour la sous-catégorie dans {table_name}"
-                    )
-                sub_category_column = roles.sub_category_field
-            elif SUB_CATEGORY_COLUMN_NAME in headers_set:
-                sub_category_column = SUB_CATEGORY_COLUMN_NAME
-
-            if not category_column or not sub_category_column:
+        sub_category_column = None
+        if roles.sub_category_field:
+            if roles.sub_category_field not in headers_set:
                 raise ValueError(
-                    "Colonnes requises manquantes pour l'exploration: configurez une catégorie et sous-catégorie."
+                    f"Colonne '{roles.sub_category_field}' introuvable pour la sous-catégorie dans {table_name}"
                 )
+            sub_category_column = roles.sub_category_field
+        elif SUB_CATEGORY_COLUMN_NAME in headers_set:
+            sub_category_column = SUB_CATEGORY_COLUMN_NAME
 
-            sort_direction = None
-            if sort_date:
-                normalized_sort = sort_date.strip().casefold()
-                if normalized_sort not in {"asc", "desc"}:
-                    raise ValueError("Paramètre 'sort_date' invalide (attendu: asc ou desc)")
-                sort_direction = normalized_sort
-
-            date_column = None
-            if roles.date_field:
-                if roles.date_field not in headers_set:
-                    raise ValueError(
-                        f"Colonne '{roles.date_field}' introuvable pour la date dans {table_name}"
-                    )
-                date_column = roles.date_field
-            elif sort_direction or normalized_from or normalized_to:
-                for name in headers:
-                    if name.casefold() == "date":
-                        date_column = name
-                        break
-                if date_column is None:
-                    raise ValueError("Colonne de date introuvable pour appliquer tri/filtre.")
-
-            for row in reader:
-                cat_value = _clean_text(row.get(category_column))
-                sub_value = _clean_text(row.get(sub_category_column))
-                if cat_value == category and sub_value == sub_category:
-                    normalized_value = _normalize_date(row.get(date_column)) if date_column else None
-                    if normalized_value:
-                        if date_domain_min is None or normalized_value < date_domain_min:
-                            date_domain_min = normalized_value
-                        if date_domain_max is None or normalized_value > date_domain_max:
-                            date_domain_max = normalized_value
-
-                    if date_column and (normalized_from or normalized_to):
-                        if normalized_value is None:
-                            continue
-                        if normalized_from and normalized_value < normalized_from:
-                            continue
-                        if normalized_to and normalized_value > normalized_to:
-                            continue
-                    matching_rows += 1
-                    matched_rows.append(row)  # type: ignore[arg-type]
-
-        if sort_direction and date_column:
-            def _sort_key(row: Mapping[str, object | None]) -> str:
-                normalized = _normalize_date(row.get(date_column))
-                if normalized:
-                    return normalized
-                fallback = _clean_text(row.get(date_column))
-                return fallback or ""
+        if not category_column or not sub_category_column:
+            raise ValueError(
+                "Colonnes requises manquantes pour l'exploration: configurez une catégorie et sous-catégorie."
+            )
+
+        sort_direction = None
+        if sort_date:
+            normalized_sort = sort_date.strip().casefold()
+            if normalized_sort not in {"asc", "desc"}:
+                raise ValueError("Paramètre 'sort_date' invalide (attendu: asc ou desc)")
+            sort_direction = normalized_sort
 
-            matched_rows.sort(key=_sort_key, reverse=sort_direction == "desc")
+        date_column = None
+        if roles.date_field:
+            if roles.date_field not in headers_set:
+                raise ValueError(
+                    f"Colonne '{roles.date_field}' introuvable pour la date dans {table_name}"
+                )
+            date_column = roles.date_field
+        elif sort_direction or normalized_from or normalized_to:
+            for name in headers:
+                if name.casefold() == "date":
+                    date_column = name
+                    break
+            if date_column is None:
+                raise ValueError("Colonne de date introuvable pour appliquer tri/filtre.")
 
-        preview_rows = matched_rows[offset : offset + limit]
+        delimiter = "," if path.suffix.lower() == ".csv" else "\t"
+        # One handle for the index and the page: offsets always match the file they were taken from.
+        with path.open("rb") as handle:
+            group = self._explore_group(
+                handle,
+                table_name=table_name,
+                delimiter=delimiter,
+                category_column=category_column,
+                sub_category_column=sub_category_column,
+                group_key=(category, sub_category),
+            )
+            date_domain_min = None
+            date_domain_max = None
+            if date_column:
+                # Only this group's date cells are read and normalised (parses are memoised).
+                date_idx = {name: idx for idx, name in enumerate(headers)}[date_column]
+                entries = []
+                for start, row in zip(group, _records_at(handle, group, delimiter)):
+                    raw_date = row[date_idx] if date_idx < len(row) else None
+                    entries.append((_normalize_date(raw_date) if raw_date else None, raw_date, start))
+                group_dates = [normalized for normalized, _, _ in entries if normalized]
+                date_domain_min = min(group_dates) if group_dates else None
+                date_domain_max = max(group_dates) if group_dates else None
+
+                if normalized_from or normalized_to:
+                    # Bounds resolved once: an open side compares against a sentinel that brackets every ISO date.
+                    lower = normalized_from or ""
+                    upper = normalized_to or "\uffff"
+                    entries = [entry for entry in entries if entry[0] and lower <= entry[0] <= upper]
+                matching_rows = len(entries)
+
+                if sort_direction:
+                    def _sort_key(item: tuple[str | None, str | None, int]) -> str:
+                        normalized, raw_date, _ = item
+                        if normalized:
+                            return normalized
+                        fallback = _clean_text(raw_date)
+                        return fallback or ""
+
+                    # Only the requested page is needed: partial selection, same order as a stable sort.
+                    select = heapq.nlargest if sort_direction == "desc" else heapq.nsmallest
+                    entries = select(offset + limit, entries, key=_sort_key)
+
+                page = [start for _, _, start in entries[offset : offset + limit]]
+            else:
+                matching_rows = len(group)
+                page = group[offset : offset + limit]
+            preview_rows = [_explore_record(headers, row) for row in _records_at(handle, page, delimiter)]
 
         log.info(
             "Explore table %s pour Category=%s, Sub Category=%s : lignes=%d, aperçu=%d (offset=%d, limit=%d, sort_date=%s, date_from=%s, date_to=%s)",
@@ -13,7 +13,7 @@ from ..core.config import settings
 log = logging.getLogger("insight.services.dictionary")
 
 
-ALLOWED_COLUMN_KEYS = {
+ALLOWED_COLUMN_KEYS = frozenset({
     "name",
     "description",
     "type",
@@ -23,7 +23,7 @@ ALLOWED_COLUMN_KEYS = {
     "pii",
     "nullable",
     "enum",
-}
+})
 
 
 def _clean_str(value: Any) -> str | None:
@@ -36,22 +36,20 @@ def _clean_str(value: Any) -> str | None:
 def _clean_str_list(values: Any) -> list[str]:
     if not isinstance(values, (list, tuple)):
         return []
-    out = []
+    # Strip, drop empties and deduplicate case-insensitively in one pass, preserving order
+    seen: set[str] = set()
+    deduped: list[str] = []
     for v in values:
         if v is None:
             continue
         s = str(v).strip()
-        if s:
-            out.append(s)
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for v in out:
-        key = v.casefold()
+        if not s:
+            continue
+        key = s.casefold()
         if key in seen:
             continue
         seen.add(key)
-        deduped.append(v)
+        deduped.append(s)
     return deduped
 
 
@@ -148,7 +146,9 @@ class DictionaryService:
         if not table:
             raise ValueError("Le nom de table est requis.")
         schema_columns = self._schema_columns(table)
-        allowed = {name.casefold(): name for name in schema_columns}
+        # Casefold each schema column once; reused for validation and the final ordering.
+        folded_columns = [(name, name.casefold()) for name in schema_columns]
+        allowed = {norm: name for name, norm in folded_columns}
         existing = self.dictionary_repo.load_table(table) or {}
         existing_cols = existing.get("columns") or []
         existing_lookup: Dict[str, Dict[str, Any]] = {}
@@ -194,8 +194,7 @@ class DictionaryService:
             incoming_lookup[norm] = col
 
         final_columns: list[Dict[str, Any]] = []
-        for name in schema_columns:
-            norm = name.casefold()
+        for name, norm in folded_columns:
             base = dict(existing_lookup.get(norm, {}))
             base["name"] = name
             incoming = incoming_lookup.get(norm)
@@ -97,9 +97,10 @@ class LoopService:
                 detail=f"Aucun ticket exploitable pour la table {config.table_name}.",
             )
 
-        daily_groups = self._group_by_day(entries)
-        weekly_groups = self._group_by_week(entries)
-        monthly_groups = self._group_by_month(entries)
+        day_buckets = self._bucket_by_day(entries)
+        daily_groups = self._group_by_day(day_buckets)
+        weekly_groups = self._group_by_week(day_buckets)
+        monthly_groups = self._group_by_month(day_buckets)
         if not daily_groups and not weekly_groups and not monthly_groups:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -187,13 +188,18 @@ class LoopService:
         except ValueError:
             return None
 
-    def _group_by_week(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        buckets: dict[tuple[int, int], list[dict[str, Any]]] = {}
+    def _bucket_by_day(self, entries: List[Dict[str, Any]]) -> dict[date, list[dict[str, Any]]]:
+        # One pass over the tickets; weeks and months are derived from these day buckets.
+        buckets: dict[date, list[dict[str, Any]]] = {}
         for item in entries:
-            d: date = item["date"]
+            buckets.setdefault(item["date"], []).append(item)
+        return buckets
+
+    def _group_by_week(self, day_buckets: dict[date, list[dict[str, Any]]]) -> List[Dict[str, Any]]:
+        buckets: dict[tuple[int, int], list[dict[str, Any]]] = {}
+        for d, day_items in day_buckets.items():
             iso = d.isocalendar()
-            key = (iso.year, iso.week)
-            buckets.setdefault(key, []).append(item)
+            buckets.setdefault((iso.year, iso.week), []).extend(day_items)
         groups: list[dict[str, Any]] = []
         for (year, week), items in buckets.items():
             start = date.fromisocalendar(year, week, 1)
@@ -210,12 +216,10 @@ class LoopService:
         limit = max(1, int(settings.loop_max_weeks))
         return groups[:limit]
 
-    def _group_by_month(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _group_by_month(self, day_buckets: dict[date, list[dict[str, Any]]]) -> List[Dict[str, Any]]:
         buckets: dict[tuple[int, int], list[dict[str, Any]]] = {}
-        for item in entries:
-            d: date = item["date"]
-            key = (d.year, d.month)
-            buckets.setdefault(key, []).append(item)
+        for d, day_items in day_buckets.items():
+            buckets.setdefault((d.year, d.month), []).extend(day_items)
         groups: list[dict[str, Any]] = []
         for (year, month), items in buckets.items():
             start = date(year, month, 1)
@@ -233,11 +237,7 @@ class LoopService:
         limit = max(1, int(settings.loop_max_months))
         return groups[:limit]
 
-    def _group_by_day(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        buckets: dict[date, list[dict[str, Any]]] = {}
-        for item in entries:
-            buckets.setdefault(item["date"], []).append(item)
-
+    def _group_by_day(self, buckets: dict[date, list[dict[str, Any]]]) -> List[Dict[str, Any]]:
         limit = max(1, int(settings.loop_max_days))
         today = date.today()
         ordered_dates: list[date] = [today] + [d for d in sorted(buckets.keys(), reverse=True) if d != today]
@@ -5,6 +5,7 @@ import os
 import sys
 from contextlib import asynccontextmanager
 from functools import lru_cache
+from pathlib import Path
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Dict, Iterable, List, TextIO, Tuple
 
@@ -24,7 +25,6 @@ from pydantic_ai import models as ai_models
 from pydantic_ai.providers.openai import OpenAIProvider
 
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from anyio.streams.text import TextReceiveStream
 from mcp.client import stdio as mcp_stdio
 from mcp.shared.message import SessionMessage
 import mcp.types as mcp_types
@@ -42,14 +42,27 @@ class ChartGenerationError(RuntimeError):
 log = logging.getLogger("insight.services.mcp_chart")
 _stdout_log = log.getChild("stdio")
 
+# MCP server names accepted as the chart backend
+CHART_SERVER_NAMES = frozenset({"chart", "mcp-server-chart"})
 
-def _should_suppress_json_error(raw_line: str) -> bool:
-    text = raw_line.strip()
+
+def _should_suppress_json_error(text: str) -> bool:
+    # Expects the already stripped line
     if not text:
         return True
     return "jsonrpc" not in text
 
 
+def _is_stdout_noise(stripped: bytes, server: mcp_stdio.StdioServerParameters) -> bool:
+    # Decodes only lines that are candidates for suppression; logs the skipped ones
+    preview = stripped.decode(server.encoding, server.encoding_error_handler).strip()
+    if not _should_suppress_json_error(preview):
+        return False
+    if preview:
+        _stdout_log.debug("Ignored MCP stdout noise: %s", preview[:200])
+    return True
+
+
 @lru_cache
 def _openai_http_client(verify_ssl: bool) -> httpx.AsyncClient:
     timeout = httpx.Timeout(timeout=600, connect=5)
@@ -60,6 +73,28 @@ def _openai_http_client(verify_ssl: bool) -> httpx.AsyncClient:
     )
 
 
+# Arguments are the config inputs: an edited MCP config file or env JSON yields a new key
+@lru_cache(maxsize=8)
+def _chart_spec(
+    servers_json: str | None, config_path: str | None, config_mtime_ns: int | None
+) -> MCPServerSpec | None:
+    for spec in MCPManager().list_servers():
+        if spec.name in CHART_SERVER_NAMES:
+            log.info("Serveur MCP chart résolu: %s", spec.name)
+            return spec
+    return None
+
+
+@lru_cache
+def _openai_provider(base_url: str, api_key: str | None, verify_ssl: bool) -> OpenAIProvider:
+    # One provider per endpoint, so every chart reuses the same client over the pooled connections
+    return OpenAIProvider(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=_openai_http_client(verify_ssl),
+    )
+
+
 @asynccontextmanager
 async def _filtered_stdio_client(
     server: mcp_stdio.StdioServerParameters,
@@ -98,23 +133,21 @@ async def _filtered_stdio_client(
 
         try:
             async with read_stream_writer:
-                buffer = ""
-                async for chunk in TextReceiveStream(
-                    process.stdout,
-                    encoding=server.encoding,
-                    errors=server.encoding_error_handler,
-                ):
-                    lines = (buffer + chunk).split("\n")
+                # JSON-RPC over stdio is UTF-8: validate raw lines, decode only noise for logging
+                buffer = b""
+                async for chunk in process.stdout:
+                    lines = (buffer + chunk).split(b"\n")
                     buffer = lines.pop()
 
                     for line in lines:
+                        stripped = line.strip()
+                        # JSON-RPC messages are objects: other lines are noise, skip them without a failed parse
+                        if not stripped.startswith(b"{") and _is_stdout_noise(stripped, server):
+                            continue
                         try:
                             message = mcp_types.JSONRPCMessage.model_validate_json(line)
                         except Exception as exc:  # pragma: no cover - depends on external server
-                            if _should_suppress_json_error(line):
-                                preview = line.strip()
-                                if preview:
-                                    _stdout_log.debug("Ignored MCP stdout noise: %s", preview[:200])
+                            if _is_stdout_noise(stripped, server):
                                 continue
                             _stdout_log.exception("Failed to parse JSONRPC message from server")
                             await read_stream_writer.send(exc)
@@ -262,6 +295,12 @@ class LenientOpenAIChatModel(OpenAIChatModel):
         return super()._process_response(response)
 
 
+@lru_cache
+def _chart_model(model_name: str, provider: OpenAIProvider) -> LenientOpenAIChatModel:
+    # Providers are cached per endpoint, so each (model, endpoint) pair builds its model once
+    return LenientOpenAIChatModel(model_name=model_name, provider=provider)
+
+
 class ChartGenerationService:
     """Generates charts dynamically through the MCP chart server."""
 
@@ -300,8 +339,7 @@ class ChartGenerationService:
         )
 
         provider, model_name = self._build_provider()
-        env = os.environ.copy()
-        env.update(self._chart_spec.env or {})
+        env = os.environ | (self._chart_spec.env or {})
 
         server = FilteredMCPServerStdio(
             self._chart_spec.command,
@@ -312,7 +350,7 @@ class ChartGenerationService:
             read_timeout=300,
         )
 
-        model = LenientOpenAIChatModel(model_name=model_name, provider=provider)
+        model = _chart_model(model_name, provider)
         agent = Agent(
             model,
             name="mcp-chart",
@@ -370,13 +408,17 @@ class ChartGenerationService:
         )
 
     def _resolve_chart_spec(self) -> MCPServerSpec:
-        manager = MCPManager()
-        for spec in manager.list_servers():
-            if spec.name in {"chart", "mcp-server-chart"}:
-                return spec
-        raise ChartGenerationError(
-            "Serveur MCP 'chart' introuvable. Vérifiez MCP_CONFIG_PATH ou MCP_SERVERS_JSON."
-        )
+        config_path = settings.mcp_config_path
+        try:
+            config_mtime_ns = Path(config_path).stat().st_mtime_ns if config_path else None
+        except FileNotFoundError:
+            config_mtime_ns = None
+        spec = _chart_spec(settings.mcp_servers_json, config_path, config_mtime_ns)
+        if spec is None:
+            raise ChartGenerationError(
+                "Serveur MCP 'chart' introuvable. Vérifiez MCP_CONFIG_PATH ou MCP_SERVERS_JSON."
+            )
+        return spec
 
     def _build_provider(self) -> tuple[OpenAIProvider, str]:
         if settings.llm_mode not in {"local", "api"}:
@@ -403,13 +445,7 @@ class ChartGenerationService:
                 settings.llm_verify_ssl,
             )
 
-        http_client = _openai_http_client(verify_ssl)
-        provider = OpenAIProvider(
-            base_url=base_url,
-            api_key=api_key,
-            http_client=http_client,
-        )
-        return provider, model_name
+        return _openai_provider(base_url, api_key, verify_ssl), model_name
 
     @staticmethod
     def _normalize_rows(columns: List[str], rows: Iterable[Any]) -> List[Dict[str, Any]]:
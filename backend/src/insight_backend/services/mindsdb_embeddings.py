@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Protocol
 
 import yaml
 
@@ -14,6 +15,9 @@ from ..integrations.openai_client import OpenAICompatibleClient
 
 log = logging.getLogger("insight.services.mindsdb_embeddings")
 
+# libyaml-backed parser when PyYAML was built with it (standard wheels are)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class EmbeddingClient(Protocol):
     """Minimal contract shared by local/API embedding backends."""
@@ -30,6 +34,7 @@ class EmbeddingTableConfig:
     source_column: str
     embedding_column: str
     model: str | None = None
+    decimals: int | None = None
 
 
 @dataclass(frozen=True)
@@ -39,6 +44,13 @@ class EmbeddingConfig:
     batch_size: int
 
 
+# Parsed YAML per file version: an edited config gets a new key. Callers must not mutate the result.
+@lru_cache(maxsize=8)
+def _read_config_yaml(path: str, mtime_ns: int, size: int) -> object:
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YAML_LOADER) or {}
+
+
 def load_embedding_config(raw_path: str | None) -> EmbeddingConfig | None:
     """Parse the YAML configuration describing MindsDB embedding columns."""
     if not raw_path:
@@ -49,8 +61,8 @@ def load_embedding_config(raw_path: str | None) -> EmbeddingConfig | None:
     if not resolved.exists():
         raise FileNotFoundError(f"MindsDB embedding config not found: {resolved}")
 
-    with resolved.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+    stat = resolved.stat()
+    data = _read_config_yaml(str(resolved), stat.st_mtime_ns, stat.st_size)
 
     if not isinstance(data, dict):
         raise ValueError("MindsDB embedding config must be a mapping at the top level.")
@@ -76,16 +88,22 @@ def load_embedding_config(raw_path: str | None) -> EmbeddingConfig | None:
         source_column = table_config.get("source_column")
         embedding_column = table_config.get("embedding_column")
         model = table_config.get("model")
+        decimals = table_config.get("decimals")
         if not source_column or not isinstance(source_column, str):
             raise ValueError(f"Table {table_name!r} requires a string 'source_column'.")
         if not embedding_column or not isinstance(embedding_column, str):
             raise ValueError(f"Table {table_name!r} requires a string 'embedding_column'.")
         if model is not None and not isinstance(model, str):
             raise ValueError(f"Table {table_name!r} has an invalid 'model' value (must be string).")
+        if decimals is not None and (isinstance(decimals, bool) or not isinstance(decimals, int) or decimals < 0):
+            raise ValueError(
+                f"Table {table_name!r} has an invalid 'decimals' value (must be a non-negative integer)."
+            )
         tables[table_name] = EmbeddingTableConfig(
             source_column=source_column,
             embedding_column=embedding_column,
             model=model,
+            decimals=decimals,
         )
 
     if not tables:
@@ -143,14 +161,9 @@ class _SentenceTransformerClient:
             convert_to_numpy=True,
             show_progress_bar=False,
         )
-        processed: list[list[float]] = []
-        for vec in vectors:
-            if hasattr(vec, "tolist"):
-                raw = vec.tolist()  # type: ignore[assignment]
-            else:
-                raw = vec
-            processed.append([float(item) for item in raw])
-        return processed
+        # One tolist() on the whole (n, dim) array converts every component in C
+        rows = vectors.tolist() if hasattr(vectors, "tolist") else vectors
+        return [list(map(float, row)) for row in rows]
 
     def close(self) -> None:  # pragma: no cover - nothing to clean explicitly
         return
@@ -179,13 +192,13 @@ def build_embedding_client(config: EmbeddingConfig) -> tuple[EmbeddingClient, st
     raise RuntimeError("EMBEDDING_MODE must be 'local' or 'api' to compute embeddings.")
 
 
-def normalise_embedding(value: object) -> Iterable[float]:
-    """Convert embedding payloads (list or JSON string) into a float iterator."""
+def normalise_embedding(value: object) -> tuple[float, ...]:
+    """Convert embedding payloads (list or JSON string) into a tuple of floats."""
     if isinstance(value, str):
         raw = json.loads(value)
     else:
         raw = value
     if not isinstance(raw, (list, tuple)):
         raise ValueError(f"Unexpected embedding payload: {type(raw)!r}")
-    for item in raw:
-        yield float(item)
+    # map(float) converts in C; the tuple is used as-is by the retrieval scorer
+    return tuple(map(float, raw))
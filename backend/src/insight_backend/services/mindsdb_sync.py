@@ -3,9 +3,12 @@ from __future__ import annotations
 import csv
 import json
 import logging
-import shutil
+import mmap
+import os
 import tempfile
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Callable
 
@@ -28,6 +31,12 @@ log = logging.getLogger("insight.services.mindsdb_sync")
 
 STATE_FILENAME = ".mindsdb_sync_state.json"
 CACHE_DIR_NAME = ".mindsdb_cache"
+# Compact encoder built once; json.dumps with custom separators builds a new encoder per call
+_EMBEDDING_ENCODER = json.JSONEncoder(separators=(",", ":"))
+# Rows held per window when embedding a table; repeated texts are deduplicated within a window
+EMBEDDING_WINDOW_ROWS = 1024
+# Approximate token budget per embedding request (about 4 characters per token)
+EMBEDDING_MAX_TOKENS_PER_BATCH = 8192
 
 
 def sync_all_tables() -> list[str]:
@@ -55,107 +64,158 @@ def sync_all_tables() -> list[str]:
 
     client = MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
     uploaded: list[str] = []
+    # One listing for the whole sync; without previous state no table can be skipped anyway
+    remote_tables = _list_remote_tables(client) if previous_state else set()
     try:
-        for path in files:
-            table_name = path.stem
-            table_cfg = config.tables.get(table_name) if config else None
-            source_hash = _compute_file_hash(path)
-            embedding_signature: dict[str, object] | None = None
-            if table_cfg and embedding_default_model:
-                resolved_model = table_cfg.model or embedding_default_model
-                embedding_signature = {
-                    "model": resolved_model,
-                    "source_column": table_cfg.source_column,
-                    "embedding_column": table_cfg.embedding_column,
-                }
-            previous_entry = previous_state.get(table_name) if previous_state else None
-            # Skip only when unchanged AND the table already exists remotely. MindsDB container
-            # is recreated at each start in dev, so we must re-upload when absent remotely
-            # even if the local cache matches.
-            cache_is_valid = (
-                previous_entry
-                and previous_entry.get("source_hash") == source_hash
-                and previous_entry.get("embedding") == embedding_signature
-            )
-            if cache_is_valid:
-                if _remote_table_exists(client, table_name):
-                    log.info("Skipping %s (cached, unchanged, present remotely)", table_name)
-                    next_state[table_name] = previous_entry
-                    continue
-                else:
-                    log.info("Re-uploading %s (absent in MindsDB, cache intact)", table_name)
-
-            tmp_path: Path | None = None
+        # Tables are independent: up to MINDSDB_SYNC_CONCURRENCY of them hash, embed and upload at once.
+        # Results are collected in file order, so the state and the returned list stay deterministic.
+        with ThreadPoolExecutor(max_workers=settings.mindsdb_sync_concurrency) as executor:
+            futures = [
+                executor.submit(
+                    _sync_one_table,
+                    path,
+                    tables_dir=repo.tables_dir,
+                    config=config,
+                    previous_entry=previous_state.get(path.stem) if previous_state else None,
+                    remote_tables=remote_tables,
+                    client=client,
+                    embedding_client=embedding_client,
+                    embedding_default_model=embedding_default_model,
+                )
+                for path in files
+            ]
             try:
-                if table_cfg:
-                    if embedding_client is None or embedding_default_model is None:
-                        raise RuntimeError("Embedding client not initialised.")
-
-                    # Check if we have a cached file with embeddings
-                    cached_path = _cached_file_path(repo.tables_dir, table_name, source_hash, path.suffix)
-
-                    if cache_is_valid and cached_path.exists():
-                        # Reuse cached file with embeddings (avoid recomputing)
-                        upload_source = cached_path
-                        log.info(
-                            "Uploading %s with embeddings from cache (model=%s)",
-                            table_name,
-                            embedding_signature["model"] if embedding_signature else None,
-                        )
-                    else:
-                        # Compute embeddings and cache the result
-                        tmp_path = _augment_with_embeddings(
-                            source_path=path,
-                            table_name=table_name,
-                            table_cfg=table_cfg,
-                            client=embedding_client,
-                            default_model=embedding_default_model,
-                            batch_size=config.batch_size,
-                        )
-                        # Save to cache
-                        cache_dir = _cache_dir_path(repo.tables_dir)
-                        cache_dir.mkdir(exist_ok=True)
-                        # Copy tmp file to cache (keep tmp_path for cleanup)
-                        shutil.copy2(tmp_path, cached_path)
-                        log.info(
-                            "Cached embeddings for %s at %s",
-                            table_name,
-                            cached_path.relative_to(repo.tables_dir),
-                        )
-                        # Clean up old cache files
-                        _cleanup_old_cache_files(repo.tables_dir, table_name, source_hash, path.suffix)
-
-                        upload_source = tmp_path
-                        log.info(
-                            "Uploading %s with fresh embeddings (%s → %s, model=%s)",
-                            table_name,
-                            table_cfg.source_column,
-                            table_cfg.embedding_column,
-                            embedding_signature["model"] if embedding_signature else None,
-                        )
-                else:
-                    upload_source = path
-                    log.info("Uploading %s without embeddings", table_name)
-                client.upload_file(upload_source, table_name=table_name)
-                uploaded.append(path.name)
-                next_state[table_name] = {
-                    "source_hash": source_hash,
-                    "embedding": embedding_signature,
-                }
-            finally:
-                if tmp_path:
-                    tmp_path.unlink(missing_ok=True)
+                for path, future in zip(files, futures):
+                    entry, was_uploaded = future.result()
+                    next_state[path.stem] = entry
+                    if was_uploaded:
+                        uploaded.append(path.name)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
     finally:
         client.close()
         if embedding_client:
             embedding_client.close()
 
-    _save_state(state_path, next_state)
+    # A sync that skipped every table leaves the state as it was: no rewrite
+    if next_state != previous_state:
+        _save_state(state_path, next_state)
 
     log.info("Uploaded %d tables to MindsDB", len(uploaded))
     return uploaded
 
 
+def _sync_one_table(
+    path: Path,
+    *,
+    tables_dir: Path,
+    config: EmbeddingConfig | None,
+    previous_entry: dict[str, object] | None,
+    remote_tables: set[str] | None,
+    client: MindsDBClient,
+    embedding_client: EmbeddingClient | None,
+    embedding_default_model: str | None,
+) -> tuple[dict[str, object], bool]:
+    """Upload one table when needed; returns its next state entry and whether it was uploaded."""
+    table_name = path.stem
+    table_cfg = config.tables.get(table_name) if config else None
+    stat = path.stat()
+    fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    # Same size and mtime as the last sync: trust the recorded hash instead of re-reading the file
+    if (
+        previous_entry
+        and previous_entry.get("size") == stat.st_size
+        and previous_entry.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        source_hash = previous_entry["source_hash"]
+    else:
+        source_hash = _compute_file_hash(path)
+    embedding_signature: dict[str, object] | None = None
+    if table_cfg and embedding_default_model:
+        resolved_model = table_cfg.model or embedding_default_model
+        embedding_signature = {
+            "model": resolved_model,
+            "source_column": table_cfg.source_column,
+            "embedding_column": table_cfg.embedding_column,
+        }
+        # Only when set, so existing signatures (and cached embeddings) stay valid
+        if table_cfg.decimals is not None:
+            embedding_signature["decimals"] = table_cfg.decimals
+    # Skip only when unchanged AND the table already exists remotely. MindsDB container
+    # is recreated at each start in dev, so we must re-upload when absent remotely
+    # even if the local cache matches.
+    cache_is_valid = (
+        previous_entry
+        and previous_entry.get("source_hash") == source_hash
+        and previous_entry.get("embedding") == embedding_signature
+    )
+    if cache_is_valid:
+        if remote_tables is None or table_name in remote_tables:
+            log.info("Skipping %s (cached, unchanged, present remotely)", table_name)
+            return {**previous_entry, **fingerprint}, False
+        else:
+            log.info("Re-uploading %s (absent in MindsDB, cache intact)", table_name)
+
+    tmp_path: Path | None = None
+    try:
+        if table_cfg:
+            if embedding_client is None or embedding_default_model is None:
+                raise RuntimeError("Embedding client not initialised.")
+
+            # Check if we have a cached file with embeddings
+            cached_path = _cached_file_path(tables_dir, table_name, source_hash, path.suffix)
+
+            if cache_is_valid and cached_path.exists():
+                # Reuse cached file with embeddings (avoid recomputing)
+                upload_source = cached_path
+                log.info(
+                    "Uploading %s with embeddings from cache (model=%s)",
+                    table_name,
+                    embedding_signature["model"] if embedding_signature else None,
+                )
+            else:
+                # Compute embeddings straight into the cache directory, then rename into place
+                cache_dir = _cache_dir_path(tables_dir)
+                cache_dir.mkdir(exist_ok=True)
+                tmp_path = _augment_with_embeddings(
+                    source_path=path,
+                    table_name=table_name,
+                    table_cfg=table_cfg,
+                    client=embedding_client,
+                    default_model=embedding_default_model,
+                    batch_size=config.batch_size,
+                    output_dir=cache_dir,
+                )
+                # Same filesystem: atomic rename, no second copy of the file
+                os.replace(tmp_path, cached_path)
+                log.info(
+                    "Cached embeddings for %s at %s",
+                    table_name,
+                    cached_path.relative_to(tables_dir),
+                )
+                # Clean up old cache files
+                _cleanup_old_cache_files(tables_dir, table_name, source_hash, path.suffix)
+
+                upload_source = cached_path
+                log.info(
+                    "Uploading %s with fresh embeddings (%s → %s, model=%s)",
+                    table_name,
+                    table_cfg.source_column,
+                    table_cfg.embedding_column,
+                    embedding_signature["model"] if embedding_signature else None,
+                )
+        else:
+            upload_source = path
+            log.info("Uploading %s without embeddings", table_name)
+        client.upload_file(upload_source, table_name=table_name)
+        return {"source_hash": source_hash, "embedding": embedding_signature, **fingerprint}, True
+    finally:
+        if tmp_path:
+            tmp_path.unlink(missing_ok=True)
+
+
 def _augment_with_embeddings(
     *,
     source_path: Path,
@@ -164,11 +224,16 @@ def _augment_with_embeddings(
     client: EmbeddingClient,
     default_model: str,
     batch_size: int,
+    output_dir: Path,
 ) -> Path:
     delimiter = "," if source_path.suffix.lower() == ".csv" else "\t"
+    model = table_cfg.model or default_model
+    concurrency = settings.mindsdb_embedding_concurrency
+    # Rows are streamed window by window: only one window of rows and vectors is held in memory.
+    window_size = max(EMBEDDING_WINDOW_ROWS, batch_size * concurrency)
     with source_path.open("r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle, delimiter=delimiter)
-        fieldnames = reader.fieldnames
+        reader = csv.reader(handle, delimiter=delimiter)
+        fieldnames = next(reader, None)
         if not fieldnames:
             raise ValueError(f"Table {table_name!r} has no header row.")
         if table_cfg.source_column not in fieldnames:
@@ -179,57 +244,76 @@ def _augment_with_embeddings(
             raise ValueError(
                 f"Embedding column '{table_cfg.embedding_column}' already present in table {table_name!r}."
             )
-        rows: list[dict[str, str]] = []
-        texts: list[str] = []
-        for idx, row in enumerate(reader):
-            if table_cfg.source_column not in row:
-                raise ValueError(
-                    f"Row {idx + 1} in table {table_name!r} lacks column '{table_cfg.source_column}'."
-                )
-            rows.append(row)
-            texts.append(row[table_cfg.source_column] or "")
-
-    embeddings: list[list[float]] = []
-    model = table_cfg.model or default_model
-    if rows:
-        desc = f"Embeddings {table_name}"
-        with tqdm(total=len(rows), desc=desc, unit="row", leave=False) as progress:
-            embeddings = _batch_embeddings(
-                client=client,
-                model=model,
-                texts=texts,
-                batch_size=batch_size,
-                progress_callback=progress.update,
-            )
-        if len(embeddings) != len(rows):
-            raise OpenAIBackendError(
-                f"Embedding backend returned {len(embeddings)} vectors for {len(rows)} rows."
-            )
-    else:
+        width = len(fieldnames)
+        # Last index wins for duplicated headers, as with csv.DictReader.
+        source_idx = {name: idx for idx, name in enumerate(fieldnames)}[table_cfg.source_column]
+
+        with tempfile.NamedTemporaryFile(
+            "w",
+            delete=False,
+            newline="",
+            encoding="utf-8",
+            suffix=source_path.suffix,
+            prefix=f".{table_name}_emb_",
+            dir=output_dir,
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                writer = csv.writer(tmp, delimiter=delimiter)
+                writer.writerow([*fieldnames, table_cfg.embedding_column])
+                row_count = 0
+                desc = f"Embeddings {table_name}"
+                with tqdm(desc=desc, unit="row", leave=False) as progress:
+                    while window := list(islice(reader, window_size)):
+                        # Blank lines are skipped, as csv.DictReader does
+                        rows = [row for row in window if row]
+                        # Each distinct text is embedded once; rows point at its position (-1: blank, no embedding)
+                        unique_texts: dict[str, int] = {}
+                        text_indices: list[int] = []
+                        for idx, row in enumerate(rows, start=row_count + 1):
+                            size = len(row)
+                            if size > width:
+                                raise ValueError(
+                                    f"Row {idx} in table {table_name!r} has more cells than the header."
+                                )
+                            # Short rows are padded so the embedding lands in its own column
+                            if size < width:
+                                row.extend([""] * (width - size))
+                            text = row[source_idx]
+                            text_indices.append(
+                                unique_texts.setdefault(text, len(unique_texts)) if text.strip() else -1
+                            )
+                        if not rows:
+                            continue
+                        embeddings = _batch_embeddings(
+                            client=client,
+                            model=model,
+                            texts=list(unique_texts),
+                            batch_size=batch_size,
+                            concurrency=concurrency,
+                            progress_callback=progress.update,
+                        )
+                        if len(embeddings) != len(unique_texts):
+                            raise OpenAIBackendError(
+                                f"Embedding backend returned {len(embeddings)} vectors for {len(unique_texts)} texts."
+                            )
+                        if table_cfg.decimals is not None:
+                            # Rounded components: shorter JSON in the cache and the MindsDB upload
+                            embeddings = [[round(x, table_cfg.decimals) for x in vector] for vector in embeddings]
+                        encoded = [_EMBEDDING_ENCODER.encode(vector) for vector in embeddings]
+                        for row, text_idx in zip(rows, text_indices):
+                            row.append(encoded[text_idx] if text_idx >= 0 else "")
+                        # Duplicates and blank texts were not sent to the backend: count them as done
+                        progress.update(len(rows) - len(unique_texts))
+                        writer.writerows(rows)
+                        row_count += len(rows)
+            except BaseException:
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+    if not row_count:
         log.warning("Table %s is empty; embedding column will be added without rows.", table_name)
-
-    with tempfile.NamedTemporaryFile(
-        "w",
-        delete=False,
-        newline="",
-        encoding="utf-8",
-        suffix=source_path.suffix,
-        prefix=f"{table_name}_emb_",
-    ) as tmp:
-        writer = csv.DictWriter(
-            tmp,
-            fieldnames=[*fieldnames, table_cfg.embedding_column],
-            delimiter=delimiter,
-        )
-        writer.writeheader()
-        for idx, row in enumerate(rows):
-            payload = dict(row)
-            payload[table_cfg.embedding_column] = json.dumps(
-                embeddings[idx],
-                separators=(",", ":"),
-            )
-            writer.writerow(payload)
-    tmp_path = Path(tmp.name)
     return tmp_path
 
 
@@ -239,11 +323,10 @@ def _batch_embeddings(
     model: str,
     texts: list[str],
     batch_size: int,
+    concurrency: int = 1,
     progress_callback: Callable[[int], None] | None = None,
 ) -> list[list[float]]:
-    results: list[list[float]] = []
-    for start in range(0, len(texts), batch_size):
-        chunk = texts[start : start + batch_size]
+    def _embed_chunk(start: int, chunk: list[str]) -> list[list[float]]:
         log.debug(
             "Requesting embeddings chunk (model=%s, offset=%d, size=%d)",
             model,
@@ -255,18 +338,54 @@ def _batch_embeddings(
             raise OpenAIBackendError(
                 f"Embedding backend returned {len(vectors)} vectors for chunk of size {len(chunk)}."
             )
-        results.extend(vectors)
-        if progress_callback:
-            progress_callback(len(chunk))
+        return vectors
+
+    results: list[list[float]] = []
+    # Up to `concurrency` batches in flight; results are collected in submission order.
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(_embed_chunk, start, texts[start:end])
+            for start, end in _plan_batches(texts, batch_size)
+        ]
+        try:
+            for future in futures:
+                vectors = future.result()
+                results.extend(vectors)
+                if progress_callback:
+                    progress_callback(len(vectors))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
     return results
 
 
+def _plan_batches(texts: list[str], batch_size: int) -> list[tuple[int, int]]:
+    """Split texts into [start, end) batches capped by count and by estimated tokens."""
+    batches: list[tuple[int, int]] = []
+    start = 0
+    tokens = 0
+    for idx, text in enumerate(texts):
+        estimate = max(1, len(text) // 4)
+        # A text over the budget still goes alone in its own batch
+        if idx > start and (idx - start >= batch_size or tokens + estimate > EMBEDDING_MAX_TOKENS_PER_BATCH):
+            batches.append((start, idx))
+            start = idx
+            tokens = 0
+        tokens += estimate
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
 def _compute_file_hash(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        # mmap cannot map an empty file
+        if os.fstat(handle.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        # Hash the mapped pages in one call: no read() copies, no per-chunk Python loop
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
 
 
 def _state_path(tables_dir: Path) -> Path:
@@ -293,24 +412,26 @@ def _save_state(path: Path, state: dict[str, dict[str, object]]) -> None:
         log.warning("Failed to persist MindsDB sync state %s: %s", path, exc)
 
 
-def _remote_table_exists(client: MindsDBClient, table_name: str) -> bool:
-    """Best-effort check that ``files.table_name`` exists on MindsDB.
+def _list_remote_tables(client: MindsDBClient) -> set[str] | None:
+    """Tables present in ``files`` on MindsDB, listed with a single query.
 
-    - Returns True when the table appears queryable.
-    - Returns False on any error (missing table, cold start), prompting a fresh upload.
+    - Returns an empty set on any error (cold start), prompting fresh uploads.
+    - Returns None when the client cannot run SQL: tables are then considered present.
     """
     db_prefix = settings.nl2sql_db_prefix or "files"
-    # Some tests stub the client without a ``sql`` method; consider it present to avoid breaking tests
+    # Some tests stub the client without a ``sql`` method; consider tables present to avoid breaking tests
     if not hasattr(client, "sql"):
-        return True
+        return None
     try:
-        result = client.sql(f"SELECT 1 FROM {db_prefix}.{table_name} LIMIT 1")
-        # Check if the result indicates an error (MindsDB returns {'type': 'error', ...})
-        if isinstance(result, dict) and result.get("type") == "error":
-            return False
-        return True
-    except Exception:
-        return False
+        result = client.sql(f"SHOW TABLES FROM {db_prefix}")
+    except Exception as exc:
+        log.warning("Unable to list MindsDB tables in %s: %s", db_prefix, exc)
+        return set()
+    # MindsDB reports SQL failures as {'type': 'error', ...}
+    if not isinstance(result, dict) or result.get("type") == "error":
+        log.warning("Unable to list MindsDB tables in %s: %s", db_prefix, result)
+        return set()
+    return {str(row[0]) for row in result.get("data") or [] if row}
 
 
 def _cache_dir_path(tables_dir: Path) -> Path:
@@ -327,16 +448,27 @@ def _cached_file_path(tables_dir: Path, table_name: str, source_hash: str, suffi
 def _cleanup_old_cache_files(tables_dir: Path, table_name: str, current_hash: str, suffix: str) -> None:
     """Remove old cached embedding files for a table (with different hash)."""
     cache_dir = _cache_dir_path(tables_dir)
-    if not cache_dir.exists():
-        return
-
-    pattern = f"{table_name}_*{suffix}"
+    prefix = f"{table_name}_"
     current_file = f"{table_name}_{current_hash}{suffix}"
 
-    for cached_file in cache_dir.glob(pattern):
-        if cached_file.name != current_file:
-            try:
-                cached_file.unlink()
-                log.debug("Removed old cache file: %s", cached_file.name)
-            except Exception as exc:
-                log.warning("Failed to remove old cache file %s: %s", cached_file, exc)
+    # One directory pass; the hash length check keeps e.g. `products_v2_<hash>` out of `products`
+    try:
+        entries = os.scandir(cache_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        stale = [
+            entry.path
+            for entry in entries
+            if entry.name != current_file
+            and entry.name.startswith(prefix)
+            and entry.name.endswith(suffix)
+            and len(entry.name) - len(prefix) - len(suffix) == len(current_hash)
+        ]
+
+    for cached_file in stale:
+        try:
+            os.unlink(cached_file)
+            log.debug("Removed old cache file: %s", os.path.basename(cached_file))
+        except Exception as exc:
+            log.warning("Failed to remove old cache file %s: %s", cached_file, exc)
@@ -143,7 +143,8 @@ class RetrievalService:
         scored: List[SimilarRow] = []
         for row in rows:
             raw_embedding = row.get(table_cfg.embedding_column)
-            if raw_embedding is None:
+            # Blank source texts are stored without embedding
+            if not raw_embedding:
                 continue
             try:
                 embedding_vec = _to_tuple(normalise_embedding(raw_embedding))
@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+
+from insight_backend.repositories.data_repository import DataRepository
+
+
+def test_get_schema_picks_up_header_changes(tmp_path: Path) -> None:
+    sample = tmp_path / "dataset.csv"
+    sample.write_text("a,b\n1,2\n", encoding="utf-8")
+    repo = DataRepository(tables_dir=tmp_path)
+
+    assert repo.get_schema("dataset") == [("a", None), ("b", None)]
+    assert repo.get_schema("dataset") == [("a", None), ("b", None)]
+
+    sample.write_text("a,b,c\n1,2,3\n", encoding="utf-8")
+    stat = sample.stat()
+    os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert repo.get_schema("dataset") == [("a", None), ("b", None), ("c", None)]
+
+
+def test_resolve_table_path_follows_directory_changes(tmp_path: Path) -> None:
+    repo = DataRepository(tables_dir=tmp_path)
+    assert repo._resolve_table_path("dataset") is None
+
+    (tmp_path / "dataset.tsv").write_text("a\n1\n", encoding="utf-8")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert repo._resolve_table_path("dataset") == tmp_path / "dataset.tsv"
+    assert repo._resolve_table_path("dataset") == tmp_path / "dataset.tsv"
+
+    (tmp_path / "dataset.tsv").unlink()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+    assert repo._resolve_table_path("dataset") is None
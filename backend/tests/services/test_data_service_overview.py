@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+
 from insight_backend.repositories.data_repository import DataRepository
-from insight_backend.services.data_service import DataService
+from insight_backend.services import data_service
+from insight_backend.services.data_service import ColumnRoles, DataService, FieldAccumulator
 from insight_backend.schemas.data import TableExplorePreview
 
 
@@ -212,3 +216,189 @@ def test_explore_table_supports_pagination_and_date_sort(tmp_path):
     assert [row["date"] for row in filtered.preview_rows] == ["2024-05-02", "2024-05-03"]
     assert filtered.date_from == "2024-05-02"
     assert filtered.date_to == "2024-05-03"
+
+
+def test_overview_reuses_sidecar_until_source_changes(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    first = service.get_overview()
+    assert first.sources[0].total_rows == 2
+    assert (tables_dir / ".overview_cache" / "dataset.csv.json").exists()
+
+    hidden = service.get_overview(hidden_fields_by_source={"dataset": ["Sub Category"]})
+    assert [item.field for item in hidden.sources[0].fields] == ["Category"]
+
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\nB,Z\n", encoding="utf-8")
+    refreshed = service.get_overview()
+    assert refreshed.sources[0].total_rows == 3
+
+
+def test_overview_memory_cache_returns_independent_copies(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    service.get_overview()
+    (tables_dir / ".overview_cache" / "dataset.csv.json").unlink()
+
+    hidden = service.get_overview(hidden_fields_by_source={"dataset": ["Sub Category"]})
+    assert [item.field for item in hidden.sources[0].fields] == ["Category"]
+    assert not (tables_dir / ".overview_cache" / "dataset.csv.json").exists()
+
+    full = service.get_overview()
+    assert [item.field for item in full.sources[0].fields] == ["Category", "Sub Category"]
+    assert not any(item.hidden for item in full.sources[0].fields)
+
+
+def test_explore_table_index_is_rebuilt_when_source_changes(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category,value\nA,X,1\nA,Y,2\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    first = service.explore_table(table_name="dataset", category="A", sub_category="X")
+    assert first.matching_rows == 1
+    other = service.explore_table(table_name="dataset", category="A", sub_category="Y")
+    assert [row["value"] for row in other.preview_rows] == ["2"]
+
+    sample.write_text("Category,Sub Category,value\nA,X,1\nA,X,3\n", encoding="utf-8")
+    refreshed = service.explore_table(table_name="dataset", category="A", sub_category="X")
+    assert [row["value"] for row in refreshed.preview_rows] == ["1", "3"]
+
+
+def test_explore_table_skips_index_above_size_limit(tmp_path, monkeypatch):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text(
+        "Category,Sub Category,date\nA,X,2024-05-02\nA,Y,2024-05-01\nA,X,01/05/2024\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(data_service, "EXPLORE_INDEX_MAX_BYTES", 10)
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    result = service.explore_table(table_name="dataset", category="A", sub_category="X", sort_date="asc")
+    assert result.matching_rows == 2
+    assert [row["date"] for row in result.preview_rows] == ["01/05/2024", "2024-05-02"]
+    assert not service._explore_cache
+
+
+def test_explore_index_keeps_only_record_offsets(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    content = 'Category,Sub Category,note\nA,X,"multi\nline"\nA,Y,plain\nA,X,last\n'
+    sample.write_bytes(content.encode("utf-8"))
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    result = service.explore_table(table_name="dataset", category="A", sub_category="X")
+    assert [row["note"] for row in result.preview_rows] == ["multi\nline", "last"]
+
+    (groups,) = service._explore_cache.values()
+    data = sample.read_bytes()
+    assert {key: list(offsets) for key, offsets in groups.items()} == {
+        ("A", "X"): [data.index(b"A,X,"), data.index(b"A,X,last")],
+        ("A", "Y"): [data.index(b"A,Y")],
+    }
+    assert all(offsets.typecode == "q" for offsets in groups.values())
+
+
+def test_explore_index_cache_respects_total_byte_budget(tmp_path, monkeypatch):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    for name in ("first", "second"):
+        (tables_dir / f"{name}.csv").write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+    size = (tables_dir / "first.csv").stat().st_size
+    monkeypatch.setattr(data_service, "EXPLORE_INDEX_MAX_BYTES", size + 1)
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    service.explore_table(table_name="first", category="A", sub_category="X")
+    service.explore_table(table_name="second", category="A", sub_category="X")
+    assert [key[0] for key in service._explore_cache] == [str(tables_dir / "second.csv")]
+
+
+def test_explore_index_is_built_once_for_concurrent_misses(tmp_path, monkeypatch):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "dataset.csv").write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+
+    builds = []
+    index_groups = data_service._index_explore_groups
+
+    def _slow_index(*args, **kwargs):
+        builds.append(args)
+        time.sleep(0.05)
+        return index_groups(*args, **kwargs)
+
+    monkeypatch.setattr(data_service, "_index_explore_groups", _slow_index)
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: service.explore_table(table_name="dataset", category="A", sub_category="X"),
+                range(8),
+            )
+        )
+    assert len(builds) == 1
+    assert all(result.matching_rows == 1 for result in results)
+    assert not service._explore_pending
+
+
+def test_clear_overview_cache_drops_table_entries(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "dataset.csv").write_text("Category,Sub Category\nA,X\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    service.get_overview()
+    service.explore_table(table_name="dataset", category="A", sub_category="X")
+    assert service._overview_cache and service._explore_cache
+
+    service.clear_overview_cache("dataset")
+    assert not service._overview_cache
+    assert not service._explore_cache
+
+
+def test_overview_sidecar_concurrent_writes_leave_no_temp_files(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    overview = service.get_overview().sources[0]
+    roles = ColumnRoles()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: service._save_overview_sidecar(sample, roles, overview), range(32)))
+
+    cache_dir = tables_dir / ".overview_cache"
+    assert [item.name for item in cache_dir.iterdir()] == ["dataset.csv.json"]
+    assert service._load_overview_sidecar(sample, roles) == overview
+
+
+def test_field_accumulator_breakdown_is_stable_across_calls():
+    accumulator = FieldAccumulator(name="event")
+    accumulator.add_many(["2024-05-01", " 2024-05-01", "2024-05-02", "n/a", ""])
+
+    first = accumulator.build_breakdown(total_rows=5)
+    second = accumulator.build_breakdown(total_rows=5)
+    assert first.kind == second.kind == "date"
+    assert [(item.label, item.count) for item in second.counts] == [("2024-05-01", 2), ("2024-05-02", 1)]
+    assert accumulator.parsed_dates == 3
+
+    accumulator.add_many(["2024-05-02"])
+    third = accumulator.build_breakdown(total_rows=6)
+    assert [(item.label, item.count) for item in third.counts] == [("2024-05-01", 2), ("2024-05-02", 2)]
+    assert third.non_null == 5
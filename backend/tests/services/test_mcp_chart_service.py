@@ -25,3 +25,48 @@ def test_openai_http_client_respects_llm_verify_ssl():
         asyncio.run(client_true.aclose())
         asyncio.run(client_false.aclose())
         service._openai_http_client.cache_clear()
+
+
+def test_openai_provider_is_reused_per_endpoint():
+    try:
+        first = service._openai_provider("http://llm.local/v1", "key", True)
+        again = service._openai_provider("http://llm.local/v1", "key", True)
+        other = service._openai_provider("http://llm.local/v1", "key", False)
+
+        assert first is again
+        assert other is not first
+    finally:
+        asyncio.run(service._openai_http_client(True).aclose())
+        asyncio.run(service._openai_http_client(False).aclose())
+        service._openai_provider.cache_clear()
+        service._openai_http_client.cache_clear()
+
+
+def test_chart_spec_is_resolved_once_per_config(monkeypatch):
+    servers = '[{"name": "chart", "command": "npx", "args": ["-y", "chart"]}]'
+    monkeypatch.setattr(service.settings, "mcp_servers_json", servers)
+    monkeypatch.setattr(service.settings, "mcp_config_path", None)
+    service._chart_spec.cache_clear()
+    try:
+        first = service.ChartGenerationService()._resolve_chart_spec()
+        again = service.ChartGenerationService()._resolve_chart_spec()
+
+        assert first is again
+        assert first.command == "npx"
+        assert service._chart_spec.cache_info().misses == 1
+    finally:
+        service._chart_spec.cache_clear()
+
+
+def test_chart_model_is_reused_per_provider():
+    try:
+        provider = service._openai_provider("http://llm.local/v1", "key", True)
+        first = service._chart_model("gpt-test", provider)
+
+        assert service._chart_model("gpt-test", provider) is first
+        assert service._chart_model("gpt-other", provider) is not first
+    finally:
+        asyncio.run(service._openai_http_client(True).aclose())
+        service._chart_model.cache_clear()
+        service._openai_provider.cache_clear()
+        service._openai_http_client.cache_clear()
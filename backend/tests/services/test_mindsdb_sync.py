@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import io
 import json
+import os
 import sys
 import types
 from pathlib import Path
@@ -10,12 +11,20 @@ from pathlib import Path
 import pytest
 
 from insight_backend.core.config import settings
-from insight_backend.services.mindsdb_sync import sync_all_tables
+from insight_backend.services import mindsdb_sync
+from insight_backend.services.mindsdb_sync import (
+    _batch_embeddings,
+    _list_remote_tables,
+    _plan_batches,
+    sync_all_tables,
+)
 from insight_backend.services.mindsdb_embeddings import (
     build_embedding_client,
     default_embedding_model,
     EmbeddingConfig,
     EmbeddingTableConfig,
+    _read_config_yaml,
+    load_embedding_config,
 )
 
 
@@ -256,3 +265,271 @@ def test_sync_all_tables_missing_source_column_raises(tmp_path: Path, monkeypatc
 
     with pytest.raises(ValueError, match="Source column 'missing' absent"):
         sync_all_tables()
+
+
+def test_batch_embeddings_keeps_row_order_with_concurrency() -> None:
+    class _EchoEmbeddingClient:
+        def embeddings(self, *, model: str, inputs: list[str]) -> list[list[float]]:
+            return [[float(text)] for text in inputs]
+
+    progress: list[int] = []
+    vectors = _batch_embeddings(
+        client=_EchoEmbeddingClient(),
+        model="test-embed",
+        texts=[str(idx) for idx in range(10)],
+        batch_size=3,
+        concurrency=4,
+        progress_callback=progress.append,
+    )
+
+    assert vectors == [[float(idx)] for idx in range(10)]
+    assert progress == [3, 3, 3, 1]
+
+
+def test_load_embedding_config_parses_yaml_once_per_file_version(tmp_path: Path) -> None:
+    config_path = tmp_path / "embed.yaml"
+    config_path.write_text(
+        "default_model: test-embed\ntables:\n  products:\n    source_column: text\n    embedding_column: emb\n",
+        encoding="utf-8",
+    )
+    _read_config_yaml.cache_clear()
+    try:
+        first = load_embedding_config(str(config_path))
+        again = load_embedding_config(str(config_path))
+        assert first == again
+        assert _read_config_yaml.cache_info().misses == 1
+
+        config_path.write_text(
+            "default_model: test-embed\ntables:\n  products:\n    source_column: body\n    embedding_column: emb\n",
+            encoding="utf-8",
+        )
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        updated = load_embedding_config(str(config_path))
+        assert updated.tables["products"].source_column == "body"
+        assert _read_config_yaml.cache_info().misses == 2
+    finally:
+        _read_config_yaml.cache_clear()
+
+
+def test_list_remote_tables_runs_a_single_query() -> None:
+    class _SqlClient:
+        def __init__(self) -> None:
+            self.queries: list[str] = []
+
+        def sql(self, query: str) -> dict[str, object]:
+            self.queries.append(query)
+            return {"type": "table", "column_names": ["Tables_in_files"], "data": [["products"], ["tickets"]]}
+
+    client = _SqlClient()
+    assert _list_remote_tables(client) == {"products", "tickets"}
+    assert len(client.queries) == 1
+
+
+def test_sync_all_tables_embeds_repeated_texts_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "products.csv").write_text("id,text\n1,hello\n2,world\n3,hello\n", encoding="utf-8")
+
+    config_path = tmp_path / "embed.yaml"
+    config_path.write_text(
+        "default_model: test-embed\ntables:\n  products:\n    source_column: text\n    embedding_column: text_embedding\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", str(config_path))
+
+    uploads: list[tuple[str | None, str]] = []
+    embedding_calls: list[dict[str, object]] = []
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=uploads),
+    )
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_embeddings.OpenAICompatibleClient",
+        lambda base_url, api_key, timeout_s: _StubEmbeddingClient(calls=embedding_calls),
+    )
+
+    sync_all_tables()
+
+    assert [call["inputs"] for call in embedding_calls] == [["hello", "world"]]
+    cached = list((tables_dir / ".mindsdb_cache").iterdir())
+    assert [p.name.startswith("products_") for p in cached] == [True]
+    assert cached[0].read_text(encoding="utf-8") == uploads[0][1]
+    rows = list(csv.DictReader(io.StringIO(uploads[0][1])))
+    assert [json.loads(row["text_embedding"]) for row in rows] == [[0.0, 0.5], [1.0, 1.5], [0.0, 0.5]]
+
+
+def test_plan_batches_caps_count_and_estimated_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("insight_backend.services.mindsdb_sync.EMBEDDING_MAX_TOKENS_PER_BATCH", 10)
+
+    texts = ["a" * 4, "b" * 4, "c" * 4, "d" * 40, "e" * 20, "f" * 20, "g" * 4]
+
+    # Tokens per text: 1, 1, 1, 10, 5, 5, 1
+    assert _plan_batches(texts, batch_size=2) == [(0, 2), (2, 3), (3, 4), (4, 6), (6, 7)]
+    assert _plan_batches([], batch_size=2) == []
+
+
+def test_sync_all_tables_uploads_tables_concurrently_in_file_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        (tables_dir / f"{name}.csv").write_text(f"id,text\n1,{name}\n", encoding="utf-8")
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", None)
+    monkeypatch.setattr(settings, "mindsdb_sync_concurrency", 3)
+
+    uploads: list[tuple[str | None, str]] = []
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=uploads),
+    )
+
+    uploaded = sync_all_tables()
+
+    assert uploaded == ["alpha.csv", "beta.csv", "gamma.csv"]
+    assert sorted(name for name, _ in uploads) == ["alpha", "beta", "gamma"]
+    state_data = json.loads((tables_dir / ".mindsdb_sync_state.json").read_text(encoding="utf-8"))
+    assert sorted(state_data) == ["alpha", "beta", "gamma"]
+
+
+def test_sync_all_tables_reuses_hash_when_fingerprint_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "products.csv").write_text("id,text\n1,hello\n", encoding="utf-8")
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", None)
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=[]),
+    )
+    hashed: list[str] = []
+    real_hash = mindsdb_sync._compute_file_hash
+    monkeypatch.setattr(
+        mindsdb_sync,
+        "_compute_file_hash",
+        lambda path: hashed.append(path.name) or real_hash(path),
+    )
+
+    assert sync_all_tables() == ["products.csv"]
+    assert sync_all_tables() == []
+    assert hashed == ["products.csv"]
+
+    state_data = json.loads((tables_dir / ".mindsdb_sync_state.json").read_text(encoding="utf-8"))
+    assert state_data["products"]["size"] == (tables_dir / "products.csv").stat().st_size
+
+
+def test_cleanup_old_cache_files_keeps_other_tables(tmp_path: Path) -> None:
+    cache_dir = tmp_path / ".mindsdb_cache"
+    cache_dir.mkdir()
+    current, old = "a" * 64, "b" * 64
+    for name in (f"products_{current}.csv", f"products_{old}.csv", f"products_v2_{old}.csv"):
+        (cache_dir / name).write_text("x", encoding="utf-8")
+
+    mindsdb_sync._cleanup_old_cache_files(tmp_path, "products", current, ".csv")
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == [f"products_{current}.csv", f"products_v2_{old}.csv"]
+
+
+def test_sync_all_tables_keeps_state_file_when_nothing_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "products.csv").write_text("id,text\n1,hello\n", encoding="utf-8")
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", None)
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=[]),
+    )
+
+    sync_all_tables()
+    state_path = tables_dir / ".mindsdb_sync_state.json"
+    state_path.write_text(state_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    before = state_path.read_text(encoding="utf-8")
+
+    assert sync_all_tables() == []
+    assert state_path.read_text(encoding="utf-8") == before
+
+
+def test_sync_all_tables_rounds_embeddings_when_decimals_set(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "products.csv").write_text("id,text\n1,hello\n", encoding="utf-8")
+
+    config_path = tmp_path / "embed.yaml"
+    config_path.write_text(
+        "default_model: test-embed\ntables:\n  products:\n    source_column: text\n"
+        "    embedding_column: text_embedding\n    decimals: 2\n",
+        encoding="utf-8",
+    )
+
+    class _PreciseEmbeddingClient:
+        def embeddings(self, *, model: str, inputs: list[str]) -> list[list[float]]:
+            return [[0.123456, -0.987654] for _ in inputs]
+
+        def close(self) -> None:  # pragma: no cover - nothing to clean
+            return
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", str(config_path))
+    uploads: list[tuple[str | None, str]] = []
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=uploads),
+    )
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_embeddings.OpenAICompatibleClient",
+        lambda base_url, api_key, timeout_s: _PreciseEmbeddingClient(),
+    )
+
+    sync_all_tables()
+
+    rows = list(csv.DictReader(io.StringIO(uploads[0][1])))
+    assert json.loads(rows[0]["text_embedding"]) == [0.12, -0.99]
+    state_data = json.loads((tables_dir / ".mindsdb_sync_state.json").read_text(encoding="utf-8"))
+    assert state_data["products"]["embedding"]["decimals"] == 2
+
+
+def test_sync_all_tables_leaves_blank_texts_without_embedding(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    (tables_dir / "products.csv").write_text('id,text\n1,hello\n2,\n3,"  "\n', encoding="utf-8")
+
+    config_path = tmp_path / "embed.yaml"
+    config_path.write_text(
+        "default_model: test-embed\ntables:\n  products:\n    source_column: text\n    embedding_column: text_embedding\n",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(settings, "tables_dir", str(tables_dir))
+    monkeypatch.setattr(settings, "mindsdb_embeddings_config_path", str(config_path))
+    uploads: list[tuple[str | None, str]] = []
+    embedding_calls: list[dict[str, object]] = []
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_sync.MindsDBClient",
+        lambda base_url, token: _StubMindsDBClient(uploads=uploads),
+    )
+    monkeypatch.setattr(
+        "insight_backend.services.mindsdb_embeddings.OpenAICompatibleClient",
+        lambda base_url, api_key, timeout_s: _StubEmbeddingClient(calls=embedding_calls),
+    )
+
+    sync_all_tables()
+
+    assert [call["inputs"] for call in embedding_calls] == [["hello"]]
+    rows = list(csv.DictReader(io.StringIO(uploads[0][1])))
+    assert [row["text_embedding"] for row in rows] == ["[0.0,0.5]", "", ""]